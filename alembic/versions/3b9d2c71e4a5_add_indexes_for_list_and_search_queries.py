@@ -0,0 +1,42 @@
+"""Add indexes for list and search queries
+
+Revision ID: 3b9d2c71e4a5
+Revises: 7285f1eed88d
+Create Date: 2026-10-15 07:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9d2c71e4a5'
+down_revision: Union[str, None] = '7285f1eed88d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ('ix_hotels_owner_id', 'hotels', ['owner_id']),
+    ('ix_hotels_is_active_rating', 'hotels', ['is_active', 'rating']),
+    ('ix_rooms_hotel_id', 'rooms', ['hotel_id']),
+    ('ix_bookings_hotel_id_created_at', 'bookings', ['hotel_id', 'created_at']),
+    ('ix_bookings_user_id_created_at', 'bookings', ['user_id', 'created_at']),
+    ('ix_guests_user_id_created_at', 'guests', ['user_id', 'created_at']),
+    ('ix_payments_payment_session_id', 'payments', ['payment_session_id']),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY can't run inside a transaction, but keeps the tables writable
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
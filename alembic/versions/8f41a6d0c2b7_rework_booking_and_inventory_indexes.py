@@ -0,0 +1,38 @@
+"""Rework booking and inventory indexes
+
+Revision ID: 8f41a6d0c2b7
+Revises: 3b9d2c71e4a5
+Create Date: 2026-10-15 08:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f41a6d0c2b7'
+down_revision: Union[str, None] = '3b9d2c71e4a5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_bookings_hotel_id_status_created_at', 'bookings', ['hotel_id', 'status', 'created_at'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True
+        )
+        # No query filters on these alone; room/date lookups use uq_room_date
+        op.drop_index('ix_bookings_check_in_date', table_name='bookings', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_bookings_check_out_date', table_name='bookings', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_inventories_date', table_name='inventories', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_inventories_date', 'inventories', ['date'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_bookings_check_out_date', 'bookings', ['check_out_date'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_bookings_check_in_date', 'bookings', ['check_in_date'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index('ix_bookings_hotel_id_status_created_at', table_name='bookings', postgresql_concurrently=True, if_exists=True)
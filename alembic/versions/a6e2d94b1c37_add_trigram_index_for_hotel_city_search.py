@@ -0,0 +1,36 @@
+"""Trigram index for the ILIKE city filter in hotel search
+
+Revision ID: a6e2d94b1c37
+Revises: f3a8c0d5b914
+Create Date: 2026-10-15 14:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6e2d94b1c37'
+down_revision: Union[str, None] = 'f3a8c0d5b914'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Search matches city with ILIKE '%...%', which a btree index can't serve.
+    # Only active hotels are ever searched.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_hotels_city_trgm', 'hotels', ['city'], unique=False,
+            postgresql_using='gin', postgresql_ops={'city': 'gin_trgm_ops'},
+            postgresql_where=sa.text('is_active = true'),
+            postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_hotels_city_trgm', table_name='hotels', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,46 @@
+"""Use NUMERIC(12, 2) for money columns
+
+Revision ID: a7d3e58c1f62
+Revises: e2a94f6b7c30
+Create Date: 2026-10-15 09:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d3e58c1f62'
+down_revision: Union[str, None] = 'e2a94f6b7c30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONEY_COLUMNS = [
+    ('bookings', 'total_price'),
+    ('payments', 'amount'),
+    ('inventories', 'price'),
+    ('rooms', 'base_price'),
+]
+
+
+def upgrade() -> None:
+    for table, column in MONEY_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=sa.Numeric(12, 2),
+            existing_type=sa.Float(),
+            existing_nullable=False,
+            postgresql_using=f'round({column}::numeric, 2)'
+        )
+
+
+def downgrade() -> None:
+    for table, column in MONEY_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=sa.Float(),
+            existing_type=sa.Numeric(12, 2),
+            existing_nullable=False
+        )
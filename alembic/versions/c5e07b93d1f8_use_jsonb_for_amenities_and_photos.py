@@ -0,0 +1,52 @@
+"""Use JSONB for amenities and photos
+
+Revision ID: c5e07b93d1f8
+Revises: 8f41a6d0c2b7
+Create Date: 2026-10-15 08:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e07b93d1f8'
+down_revision: Union[str, None] = '8f41a6d0c2b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COLUMNS = [
+    ('hotels', 'amenities'),
+    ('hotels', 'photos'),
+    ('rooms', 'amenities'),
+    ('rooms', 'photos'),
+]
+
+
+def upgrade() -> None:
+    for table, column in COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            existing_type=sa.JSON(),
+            postgresql_using=f'{column}::jsonb'
+        )
+    op.create_index(
+        'ix_hotels_amenities', 'hotels', ['amenities'], unique=False,
+        postgresql_using='gin', postgresql_ops={'amenities': 'jsonb_path_ops'}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_hotels_amenities', table_name='hotels')
+    for table, column in reversed(COLUMNS):
+        op.alter_column(
+            table, column,
+            type_=sa.JSON(),
+            existing_type=postgresql.JSONB(astext_type=sa.Text()),
+            postgresql_using=f'{column}::json'
+        )
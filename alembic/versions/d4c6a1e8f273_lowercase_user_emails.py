@@ -0,0 +1,29 @@
+"""Lowercase stored user emails
+
+Revision ID: d4c6a1e8f273
+Revises: b81f4c2d9e07
+Create Date: 2026-10-15 10:45:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4c6a1e8f273'
+down_revision: Union[str, None] = 'b81f4c2d9e07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Emails are normalized to lowercase on input now, so existing rows must
+    # match for login lookups. Fails on the unique index if two accounts only
+    # differ by case; those need merging by hand first.
+    op.execute("UPDATE users SET email = lower(email) WHERE email <> lower(email)")
+
+
+def downgrade() -> None:
+    # Original casing is not kept
+    pass
@@ -0,0 +1,35 @@
+"""Add generated inventories.remaining_count
+
+Revision ID: e2a94f6b7c30
+Revises: c5e07b93d1f8
+Create Date: 2026-10-15 09:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a94f6b7c30'
+down_revision: Union[str, None] = 'c5e07b93d1f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('inventories', sa.Column(
+        'remaining_count', sa.Integer(),
+        sa.Computed('available_count - COALESCE(booked_count, 0)', persisted=True),
+        nullable=False
+    ))
+    op.create_index(
+        'ix_inventories_room_id_date_remaining_count', 'inventories',
+        ['room_id', 'date', 'remaining_count'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_inventories_room_id_date_remaining_count', table_name='inventories')
+    op.drop_column('inventories', 'remaining_count')
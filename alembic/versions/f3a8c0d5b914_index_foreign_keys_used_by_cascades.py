@@ -0,0 +1,37 @@
+"""Index foreign keys used by cascades and guest-side lookups
+
+Revision ID: f3a8c0d5b914
+Revises: d4c6a1e8f273
+Create Date: 2026-10-15 11:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a8c0d5b914'
+down_revision: Union[str, None] = 'd4c6a1e8f273'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ('ix_bookings_room_id', 'bookings', ['room_id']),
+    ('ix_booking_guests_guest_id', 'booking_guests', ['guest_id']),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY can't run inside a transaction, but keeps the tables writable
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -1,12 +1,9 @@
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from fastapi import APIRouter, Depends, Query, status
 
-from app.db.session import get_db
 from app.models.user import User
 from app.schemas.guest import GuestCreate, GuestUpdate, GuestResponse, GuestListResponse
 from app.services.guest import GuestService
-from app.core.dependencies import get_current_active_user
+from app.core.dependencies import get_current_active_user, get_guest_service
 
 router = APIRouter()
 
@@ -15,32 +12,31 @@ router = APIRouter()
 async def add_guest(
     guest_data: GuestCreate,
     current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db)
+    guest_service: GuestService = Depends(get_guest_service)
 ):
     """Add a new guest to user's guest list"""
-    guest_service = GuestService(db)
     return await guest_service.create_guest(current_user, guest_data)
 
 
 @router.get("", response_model=GuestListResponse)
 async def get_my_guests(
+    page: int = Query(1, ge=1),
+    page_size: int = Query(100, ge=1, le=100),
     current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db)
+    guest_service: GuestService = Depends(get_guest_service)
 ):
-    """Get all guests for the current user"""
-    guest_service = GuestService(db)
-    guests = await guest_service.get_guests(current_user)
-    return GuestListResponse(guests=guests, total=len(guests))
+    """Get guests for the current user"""
+    result = await guest_service.get_guests(current_user, page, page_size)
+    return GuestListResponse(**result)
 
 
 @router.get("/{guest_id}", response_model=GuestResponse)
 async def get_guest(
     guest_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db)
+    guest_service: GuestService = Depends(get_guest_service)
 ):
     """Get a specific guest by ID"""
-    guest_service = GuestService(db)
     return await guest_service.get_guest_by_id(current_user, guest_id)
 
 
@@ -49,10 +45,9 @@ async def update_guest(
     guest_id: int,
     update_data: GuestUpdate,
     current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db)
+    guest_service: GuestService = Depends(get_guest_service)
 ):
     """Update a guest"""
-    guest_service = GuestService(db)
     return await guest_service.update_guest(current_user, guest_id, update_data)
 
 
@@ -60,9 +55,8 @@ async def update_guest(
 async def delete_guest(
     guest_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db)
+    guest_service: GuestService = Depends(get_guest_service)
 ):
     """Remove a guest"""
-    guest_service = GuestService(db)
     await guest_service.delete_guest(current_user, guest_id)
     return None
@@ -1,9 +1,8 @@
-from fastapi import APIRouter, Depends, Query, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from typing import Optional, List
 from datetime import date
 
-from app.db.session import get_db
 from app.models.user import User
 from app.schemas.hotel import (
     HotelCreate,
@@ -12,9 +11,10 @@ from app.schemas.hotel import (
     HotelListResponse,
     HotelInfoResponse,
 )
-from app.schemas.room import RoomResponse
 from app.services.hotel import HotelService
-from app.core.dependencies import get_current_hotel_admin
+from app.db.session import AsyncSessionLocal
+from app.core.cache import hotel_info_cache, hotel_search_cache, weak_etag, etag_matches
+from app.core.dependencies import get_current_hotel_admin, get_hotel_service
 
 # Public router for hotel browsing
 public_router = APIRouter()
@@ -34,17 +34,25 @@ async def search_hotels(
     rooms: Optional[int] = Query(None, ge=1, description="Number of rooms"),
     min_price: Optional[float] = Query(None, ge=0, description="Minimum price"),
     max_price: Optional[float] = Query(None, description="Maximum price"),
-    amenities: Optional[str] = Query(None, description="Comma-separated amenities"),
+    amenities: Optional[List[str]] = Query(None, description="Amenity filter (repeatable)"),
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
-    db: AsyncSession = Depends(get_db)
+    hotel_service: HotelService = Depends(get_hotel_service)
 ):
     """Search for available hotels"""
-    hotel_service = HotelService(db)
+    # Still accept the old comma-separated form (?amenities=wifi,pool)
+    if amenities and len(amenities) == 1 and "," in amenities[0]:
+        amenities = amenities[0].split(",")
 
-    amenities_list = amenities.split(",") if amenities else None
+    cache_key = (
+        city, check_in_date, check_out_date, guests, rooms, min_price, max_price,
+        tuple(sorted(amenities)) if amenities else None, page, page_size
+    )
+    cached = hotel_search_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
 
-    result = await hotel_service.search_hotels(
+    response = await hotel_service.search_hotels(
         city=city,
         check_in_date=check_in_date,
         check_out_date=check_out_date,
@@ -52,24 +60,31 @@ async def search_hotels(
         rooms=rooms,
         min_price=min_price,
         max_price=max_price,
-        amenities=amenities_list,
+        amenities=amenities,
         page=page,
         page_size=page_size
     )
 
-    return HotelListResponse(**result)
+    # Already validated by the service, so skip FastAPI's response_model round trip
+    content = response.model_dump_json()
+    hotel_search_cache[cache_key] = content
+    return Response(content=content, media_type="application/json")
 
 
 @public_router.get("/{hotel_id}/info", response_model=HotelInfoResponse)
 async def get_hotel_info(
     hotel_id: int,
-    db: AsyncSession = Depends(get_db)
+    request: Request,
+    hotel_service: HotelService = Depends(get_hotel_service)
 ):
     """Get hotel details with rooms for public view"""
-    hotel_service = HotelService(db)
+    cached = hotel_info_cache.get(hotel_id)
+    if cached is not None:
+        return _hotel_info_response(request, *cached)
+
     hotel = await hotel_service.get_hotel_info(hotel_id)
 
-    return HotelInfoResponse(
+    response = HotelInfoResponse(
         id=hotel.id,
         owner_id=hotel.owner_id,
         name=hotel.name,
@@ -87,8 +102,20 @@ async def get_hotel_info(
         total_reviews=hotel.total_reviews,
         created_at=hotel.created_at,
         updated_at=hotel.updated_at,
-        rooms=[RoomResponse.model_validate(room) for room in hotel.rooms]
+        rooms=hotel.rooms
     )
+    content = response.model_dump_json().encode()
+    etag = weak_etag(content)
+    hotel_info_cache[hotel_id] = (etag, content)
+    return _hotel_info_response(request, etag, content)
+
+
+def _hotel_info_response(request: Request, etag: str, content: bytes) -> Response:
+    """Hotel info body, or a bare 304 when the client already has it"""
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=30"}
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=content, media_type="application/json", headers=headers)
 
 
 # ============ ADMIN ENDPOINTS ============
@@ -97,10 +124,9 @@ async def get_hotel_info(
 async def create_hotel(
     hotel_data: HotelCreate,
     current_user: User = Depends(get_current_hotel_admin),
-    db: AsyncSession = Depends(get_db)
+    hotel_service: HotelService = Depends(get_hotel_service)
 ):
     """Create a new hotel"""
-    hotel_service = HotelService(db)
     return await hotel_service.create_hotel(current_user, hotel_data)
 
 
@@ -108,23 +134,32 @@ async def create_hotel(
 async def get_admin_hotels(
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
+    list_format: str = Query("json", alias="format", pattern="^(json|ndjson)$",
+                             description="json, or ndjson to stream every hotel, one per line, without paging"),
     current_user: User = Depends(get_current_hotel_admin),
-    db: AsyncSession = Depends(get_db)
+    hotel_service: HotelService = Depends(get_hotel_service)
 ):
     """Get all hotels owned by the current admin"""
-    hotel_service = HotelService(db)
-    result = await hotel_service.get_admin_hotels(current_user, page, page_size)
-    return HotelListResponse(**result)
+    if list_format == "ndjson":
+        return StreamingResponse(_stream_admin_hotels(current_user), media_type="application/x-ndjson")
+    return await hotel_service.get_admin_hotels(current_user, page, page_size)
+
+
+async def _stream_admin_hotels(user: User):
+    """One hotel per line, serialized as it comes off the cursor"""
+    # The request session is closed before the body is sent, so use our own
+    async with AsyncSessionLocal() as session:
+        async for hotel in HotelService(session).stream_admin_hotels(user):
+            yield HotelResponse.model_validate(hotel).model_dump_json().encode() + b"\n"
 
 
 @admin_router.get("/{hotel_id}", response_model=HotelResponse)
 async def get_hotel(
     hotel_id: int,
     current_user: User = Depends(get_current_hotel_admin),
-    db: AsyncSession = Depends(get_db)
+    hotel_service: HotelService = Depends(get_hotel_service)
 ):
     """Get hotel by ID"""
-    hotel_service = HotelService(db)
     return await hotel_service.get_hotel_by_id(hotel_id, current_user)
 
 
@@ -133,10 +168,9 @@ async def update_hotel(
     hotel_id: int,
     update_data: HotelUpdate,
     current_user: User = Depends(get_current_hotel_admin),
-    db: AsyncSession = Depends(get_db)
+    hotel_service: HotelService = Depends(get_hotel_service)
 ):
     """Update hotel details"""
-    hotel_service = HotelService(db)
     return await hotel_service.update_hotel(hotel_id, current_user, update_data)
 
 
@@ -144,10 +178,9 @@ async def update_hotel(
 async def delete_hotel(
     hotel_id: int,
     current_user: User = Depends(get_current_hotel_admin),
-    db: AsyncSession = Depends(get_db)
+    hotel_service: HotelService = Depends(get_hotel_service)
 ):
     """Delete a hotel"""
-    hotel_service = HotelService(db)
     await hotel_service.delete_hotel(hotel_id, current_user)
     return None
 
@@ -156,10 +189,9 @@ async def delete_hotel(
 async def activate_hotel(
     hotel_id: int,
     current_user: User = Depends(get_current_hotel_admin),
-    db: AsyncSession = Depends(get_db)
+    hotel_service: HotelService = Depends(get_hotel_service)
 ):
     """Activate a hotel (make it visible for booking)"""
-    hotel_service = HotelService(db)
     return await hotel_service.activate_hotel(hotel_id, current_user)
 
 
@@ -167,8 +199,7 @@ async def activate_hotel(
 async def deactivate_hotel(
     hotel_id: int,
     current_user: User = Depends(get_current_hotel_admin),
-    db: AsyncSession = Depends(get_db)
+    hotel_service: HotelService = Depends(get_hotel_service)
 ):
     """Deactivate a hotel"""
-    hotel_service = HotelService(db)
     return await hotel_service.deactivate_hotel(hotel_id, current_user)
@@ -1,9 +1,7 @@
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from typing import Optional
 from datetime import date
 
-from app.db.session import get_db
 from app.models.user import User
 from app.schemas.inventory import (
     InventoryUpdate,
@@ -12,7 +10,8 @@ from app.schemas.inventory import (
     InventoryListResponse,
 )
 from app.services.inventory import InventoryService
-from app.core.dependencies import get_current_hotel_admin
+from app.core.cache import weak_etag, etag_matches
+from app.core.dependencies import get_current_hotel_admin, get_inventory_service
 
 router = APIRouter()
 
@@ -20,21 +19,30 @@ router = APIRouter()
 @router.get("/rooms/{room_id}", response_model=InventoryListResponse)
 async def get_room_inventory(
     room_id: int,
+    request: Request,
     start_date: Optional[date] = Query(None, description="Start date for inventory"),
     end_date: Optional[date] = Query(None, description="End date for inventory"),
     current_user: User = Depends(get_current_hotel_admin),
-    db: AsyncSession = Depends(get_db)
+    inventory_service: InventoryService = Depends(get_inventory_service)
 ):
     """Get inventory for a room within a date range"""
-    inventory_service = InventoryService(db)
     inventories = await inventory_service.get_room_inventory(
         room_id, current_user, start_date, end_date
     )
-    return InventoryListResponse(
+
+    # Every inventory write bumps updated_at, so row ids + timestamps identify the body
+    etag = weak_etag(",".join(f"{inv.id}:{inv.updated_at}" for inv in inventories).encode())
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response = InventoryListResponse(
         inventories=inventories,
         room_id=room_id,
         total=len(inventories)
     )
+    # Already validated above, so skip FastAPI's response_model round trip
+    return Response(content=response.model_dump_json(), media_type="application/json", headers=headers)
 
 
 @router.patch("/rooms/{room_id}", response_model=InventoryListResponse)
@@ -42,10 +50,9 @@ async def update_room_inventory(
     room_id: int,
     bulk_data: InventoryBulkUpdate,
     current_user: User = Depends(get_current_hotel_admin),
-    db: AsyncSession = Depends(get_db)
+    inventory_service: InventoryService = Depends(get_inventory_service)
 ):
     """Update inventory for a room within a date range"""
-    inventory_service = InventoryService(db)
     inventories = await inventory_service.bulk_update_inventory(
         room_id, current_user, bulk_data
     )
@@ -62,10 +69,9 @@ async def update_inventory_for_date(
     inv_date: date,
     update_data: InventoryUpdate,
     current_user: User = Depends(get_current_hotel_admin),
-    db: AsyncSession = Depends(get_db)
+    inventory_service: InventoryService = Depends(get_inventory_service)
 ):
     """Update inventory for a specific date"""
-    inventory_service = InventoryService(db)
     return await inventory_service.update_inventory(
         room_id, inv_date, current_user, update_data
     )
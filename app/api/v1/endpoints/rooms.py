@@ -1,11 +1,9 @@
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, Response, status
 
-from app.db.session import get_db
 from app.models.user import User
 from app.schemas.room import RoomCreate, RoomUpdate, RoomResponse, RoomListResponse
 from app.services.room import RoomService
-from app.core.dependencies import get_current_hotel_admin
+from app.core.dependencies import get_current_hotel_admin, get_room_service
 
 router = APIRouter()
 
@@ -15,10 +13,9 @@ async def create_room(
     hotel_id: int,
     room_data: RoomCreate,
     current_user: User = Depends(get_current_hotel_admin),
-    db: AsyncSession = Depends(get_db)
+    room_service: RoomService = Depends(get_room_service)
 ):
     """Create a new room for a hotel"""
-    room_service = RoomService(db)
     return await room_service.create_room(hotel_id, current_user, room_data)
 
 
@@ -26,12 +23,13 @@ async def create_room(
 async def get_rooms(
     hotel_id: int,
     current_user: User = Depends(get_current_hotel_admin),
-    db: AsyncSession = Depends(get_db)
+    room_service: RoomService = Depends(get_room_service)
 ):
     """Get all rooms for a hotel"""
-    room_service = RoomService(db)
     rooms = await room_service.get_rooms(hotel_id, current_user)
-    return RoomListResponse(rooms=rooms, total=len(rooms))
+    response = RoomListResponse(rooms=rooms, total=len(rooms))
+    # Already validated above, so skip FastAPI's response_model round trip
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 
 @router.get("/{hotel_id}/rooms/{room_id}", response_model=RoomResponse)
@@ -39,10 +37,9 @@ async def get_room(
     hotel_id: int,
     room_id: int,
     current_user: User = Depends(get_current_hotel_admin),
-    db: AsyncSession = Depends(get_db)
+    room_service: RoomService = Depends(get_room_service)
 ):
     """Get a specific room by ID"""
-    room_service = RoomService(db)
     return await room_service.get_room_by_id(hotel_id, room_id, current_user)
 
 
@@ -52,10 +49,9 @@ async def update_room(
     room_id: int,
     update_data: RoomUpdate,
     current_user: User = Depends(get_current_hotel_admin),
-    db: AsyncSession = Depends(get_db)
+    room_service: RoomService = Depends(get_room_service)
 ):
     """Update a room"""
-    room_service = RoomService(db)
     return await room_service.update_room(hotel_id, room_id, current_user, update_data)
 
 
@@ -64,9 +60,8 @@ async def delete_room(
     hotel_id: int,
     room_id: int,
     current_user: User = Depends(get_current_hotel_admin),
-    db: AsyncSession = Depends(get_db)
+    room_service: RoomService = Depends(get_room_service)
 ):
     """Delete a room"""
-    room_service = RoomService(db)
     await room_service.delete_room(hotel_id, room_id, current_user)
     return None
@@ -1,7 +1,7 @@
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, Header, Request, Response, status
+from typing import Optional
+import orjson
 
-from app.db.session import get_db
 from app.models.user import User
 from app.schemas.payment import (
     PaymentInitiate,
@@ -10,7 +10,8 @@ from app.schemas.payment import (
     PaymentWebhookPayload,
 )
 from app.services.payment import PaymentService
-from app.core.dependencies import get_current_active_user
+from app.core.cache import idempotency_cache
+from app.core.dependencies import get_current_active_user, get_payment_service
 
 router = APIRouter()
 
@@ -20,7 +21,9 @@ router = APIRouter()
 @router.post("/payment/capture")
 async def capture_payment(
     webhook_data: PaymentWebhookPayload,
-    db: AsyncSession = Depends(get_db)
+    request: Request,
+    x_webhook_signature: Optional[str] = Header(None),
+    payment_service: PaymentService = Depends(get_payment_service)
 ):
     """
     Webhook endpoint to capture payment notification from payment gateway.
@@ -28,9 +31,21 @@ async def capture_payment(
     after a payment is processed.
 
     For mock purposes, you can call this endpoint manually to simulate payment completion.
+    When PAYMENT_WEBHOOK_SECRET is set, X-Webhook-Signature must carry the
+    hex HMAC-SHA256 of the raw body.
     """
-    payment_service = PaymentService(db)
-    return await payment_service.process_webhook(webhook_data)
+    await payment_service.verify_webhook_signature(await request.body(), x_webhook_signature)
+
+    # Providers retry deliveries; replay the first result instead of reprocessing
+    cache_key = ("capture", webhook_data.payment_session_id, webhook_data.transaction_id, webhook_data.status)
+    cached = idempotency_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    result = await payment_service.process_webhook(webhook_data)
+    content = orjson.dumps(result, default=float)
+    idempotency_cache[cache_key] = content
+    return Response(content=content, media_type="application/json")
 
 
 # ============ PAYMENT ENDPOINTS ============
@@ -40,23 +55,36 @@ async def capture_payment(
 async def initiate_payment(
     booking_id: int,
     payment_data: PaymentInitiate,
+    idempotency_key: Optional[str] = Header(None, max_length=255),
     current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db)
+    payment_service: PaymentService = Depends(get_payment_service)
 ):
     """
     Initiate payment for a booking.
     Returns a mock payment URL and session ID.
+    Repeating a request with the same Idempotency-Key returns the original response.
     """
-    payment_service = PaymentService(db)
-    return await payment_service.initiate_payment(booking_id, current_user, payment_data)
+    cache_key = None
+    if idempotency_key:
+        cache_key = ("pay", current_user.id, booking_id, idempotency_key)
+        cached = idempotency_cache.get(cache_key)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+
+    result = await payment_service.initiate_payment(booking_id, current_user, payment_data)
+    if cache_key is None:
+        return result
+
+    content = PaymentSessionResponse.model_validate(result).model_dump_json()
+    idempotency_cache[cache_key] = content
+    return Response(content=content, media_type="application/json")
 
 
 @router.get("/bookings/{booking_id}/payment", response_model=PaymentResponse)
 async def get_payment(
     booking_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db)
+    payment_service: PaymentService = Depends(get_payment_service)
 ):
     """Get payment details for a booking"""
-    payment_service = PaymentService(db)
     return await payment_service.get_payment_by_booking(booking_id, current_user)
@@ -0,0 +1,55 @@
+from cachetools import TTLCache
+from fastapi import Request
+from typing import NamedTuple
+import hashlib
+
+from app.core.config import settings
+
+# Decoded JWT payloads, keyed by a truncated SHA-256 of the raw token
+token_cache = TTLCache(maxsize=10_000, ttl=settings.TOKEN_CACHE_TTL)
+
+# Detached User snapshots for get_current_user, keyed by user id
+user_cache = TTLCache(maxsize=5000, ttl=settings.USER_CACHE_TTL)
+
+# Serialized public hotel responses (JSON bytes)
+hotel_info_cache = TTLCache(maxsize=1024, ttl=settings.HOTEL_INFO_CACHE_TTL)  # keyed by hotel_id -> (etag, body)
+hotel_search_cache = TTLCache(maxsize=1024, ttl=settings.HOTEL_SEARCH_CACHE_TTL)  # keyed by search params
+
+class HotelMeta(NamedTuple):
+    owner_id: int
+    is_active: bool
+    name: str
+
+
+# Hotel fields needed to authorize booking endpoints, keyed by hotel_id
+hotel_meta_cache = TTLCache(maxsize=10_000, ttl=settings.HOTEL_META_CACHE_TTL)
+
+# Booking status polls, keyed by booking id -> status fields plus the ids needed to authorize
+booking_status_cache = TTLCache(maxsize=10_000, ttl=settings.BOOKING_STATUS_CACHE_TTL)
+
+# Serialized payment responses, replayed for retried webhooks and double submits
+idempotency_cache = TTLCache(maxsize=10_000, ttl=settings.IDEMPOTENCY_TTL)
+
+
+def invalidate_hotel(hotel_id: int) -> None:
+    """Drop cached public responses after a hotel or one of its rooms changed"""
+    hotel_info_cache.pop(hotel_id, None)
+    hotel_meta_cache.pop(hotel_id, None)
+    hotel_search_cache.clear()
+
+
+def weak_etag(data: bytes) -> str:
+    """Weak ETag for a response body (or any bytes that change with it)"""
+    return f'W/"{hashlib.blake2b(data, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the client's If-None-Match already covers this ETag"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison: ignore the W/ prefix on both sides
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in tags
@@ -1,23 +1,83 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, inspect, lambda_stmt
+from sqlalchemy.orm import defer, make_transient_to_detached
 from typing import Optional
+import asyncio
+import hashlib
+import time
 
 from app.db.session import get_db
 from app.core.security import decode_token
+from app.core.cache import token_cache, user_cache
 from app.models.user import User, UserRole
+from app.models.hotel import Hotel
+from app.services.auth import AuthService
+from app.services.user import UserService
+from app.services.guest import GuestService
+from app.services.hotel import HotelService
+from app.services.room import RoomService
+from app.services.inventory import InventoryService
+from app.services.booking import BookingService
+from app.services.payment import PaymentService
 
 security = HTTPBearer()
 
+# Roles allowed through each privileged dependency, built once at import
+HOTEL_ADMIN_ROLES = frozenset({UserRole.HOTEL_ADMIN, UserRole.ADMIN})
+ADMIN_ROLES = frozenset({UserRole.ADMIN})
+
+
+async def _decode_token_cached(token: str) -> Optional[dict]:
+    """Decode a JWT, reusing the verified payload for repeat tokens"""
+    # Truncated binary digest: small keys, and raw tokens are never kept in memory
+    key = hashlib.sha256(token.encode()).digest()[:16]
+    payload = token_cache.get(key)
+    if payload is not None:
+        # The cache TTL can outlive the token itself
+        if payload.get("exp", 0) > time.time():
+            return payload
+        token_cache.pop(key, None)
+        return None
+
+    # Only first-seen tokens get here; verify them off the event loop
+    payload = await asyncio.to_thread(decode_token, token)
+    if payload is not None:
+        token_cache[key] = payload
+    return payload
+
+
+def _user_snapshot(user: User) -> User:
+    """Session-free copy of a loaded User that can be shared across requests"""
+    loaded = inspect(user).dict
+    snapshot = User(**{attr.key: loaded[attr.key] for attr in inspect(User).column_attrs if attr.key in loaded})
+    make_transient_to_detached(snapshot)
+    return snapshot
+
+
+async def _load_user(db: AsyncSession, user_id: int) -> Optional[User]:
+    """Load a user into the session, from the snapshot cache when possible"""
+    cached = user_cache.get(user_id)
+    if cached is not None:
+        # Attach a copy to this session without going back to the database
+        return await db.merge(cached, load=False)
+
+    # Primary key lookup goes through the identity map first. The password
+    # hash is never needed past login, so leave it out of the row.
+    user = await db.get(User, user_id, options=[defer(User.hashed_password)])
+    if user is not None:
+        user_cache[user_id] = _user_snapshot(user)
+    return user
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db)
-) -> User:
-    """Get current authenticated user from JWT token"""
-    token = credentials.credentials
-    payload = decode_token(token)
+
+# All auth dependencies chain through this one, so the token is checked once
+# per request however many dependents ask for the user.
+async def get_access_token_payload(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> dict:
+    """Verify the bearer access token and return its payload"""
+    payload = await _decode_token_cached(credentials.credentials)
 
     if payload is None:
         raise HTTPException(
@@ -41,8 +101,15 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    result = await db.execute(select(User).where(User.id == int(user_id)))
-    user = result.scalar_one_or_none()
+    return payload
+
+
+async def get_current_user(
+    payload: dict = Depends(get_access_token_payload),
+    db: AsyncSession = Depends(get_db)
+) -> User:
+    """Get current authenticated user from JWT token"""
+    user = await _load_user(db, int(payload["sub"]))
 
     if user is None:
         raise HTTPException(
@@ -73,14 +140,22 @@ async def get_current_active_user(
 
 
 async def get_current_hotel_admin(
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
 ) -> User:
     """Ensure user is a hotel admin or admin"""
-    if current_user.role not in [UserRole.HOTEL_ADMIN, UserRole.ADMIN]:
+    if current_user.role not in HOTEL_ADMIN_ROLES:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Hotel admin privileges required"
         )
+
+    # Load owned hotel ids once so services can authorize without a Hotel query
+    if current_user.role != UserRole.ADMIN:
+        owner_id = current_user.id
+        result = await db.execute(lambda_stmt(lambda: select(Hotel.id).where(Hotel.owner_id == owner_id)))
+        current_user.hotel_ids = set(result.scalars().all())
+
     return current_user
 
 
@@ -88,7 +163,7 @@ async def get_current_admin(
     current_user: User = Depends(get_current_active_user)
 ) -> User:
     """Ensure user is an admin"""
-    if current_user.role != UserRole.ADMIN:
+    if current_user.role not in ADMIN_ROLES:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin privileges required"
@@ -96,24 +171,56 @@ async def get_current_admin(
     return current_user
 
 
-def get_optional_current_user(
+async def get_optional_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
     db: AsyncSession = Depends(get_db)
-):
+) -> Optional[User]:
     """Get current user if authenticated, otherwise return None"""
-    async def _get_user():
-        if credentials is None:
-            return None
-        try:
-            token = credentials.credentials
-            payload = decode_token(token)
-            if payload is None or payload.get("type") != "access":
-                return None
-            user_id = payload.get("sub")
-            if user_id is None:
-                return None
-            result = await db.execute(select(User).where(User.id == int(user_id)))
-            return result.scalar_one_or_none()
-        except Exception:
-            return None
-    return _get_user
+    if credentials is None:
+        return None
+
+    payload = await _decode_token_cached(credentials.credentials)
+    if payload is None or payload.get("type") != "access":
+        return None
+
+    user_id = payload.get("sub")
+    if user_id is None or not str(user_id).isdigit():
+        return None
+
+    return await _load_user(db, int(user_id))
+
+
+# ============ SERVICE PROVIDERS ============
+# FastAPI caches these per request, so every dependency that asks for a
+# service (or the session behind it) within one request shares one instance.
+
+def get_auth_service(db: AsyncSession = Depends(get_db)) -> AuthService:
+    return AuthService(db)
+
+
+def get_user_service(db: AsyncSession = Depends(get_db)) -> UserService:
+    return UserService(db)
+
+
+def get_guest_service(db: AsyncSession = Depends(get_db)) -> GuestService:
+    return GuestService(db)
+
+
+def get_hotel_service(db: AsyncSession = Depends(get_db)) -> HotelService:
+    return HotelService(db)
+
+
+def get_room_service(db: AsyncSession = Depends(get_db)) -> RoomService:
+    return RoomService(db)
+
+
+def get_inventory_service(db: AsyncSession = Depends(get_db)) -> InventoryService:
+    return InventoryService(db)
+
+
+def get_booking_service(db: AsyncSession = Depends(get_db)) -> BookingService:
+    return BookingService(db)
+
+
+def get_payment_service(db: AsyncSession = Depends(get_db)) -> PaymentService:
+    return PaymentService(db)
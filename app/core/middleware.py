@@ -0,0 +1,66 @@
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.cache import weak_etag, etag_matches
+
+
+class ETagMiddleware:
+    """Add weak ETags to JSON GET responses and answer a matching If-None-Match with 304.
+
+    Endpoints that set their own ETag (hotel info, room inventory) are left alone.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        start: Message = {}
+        chunks = []
+        passthrough = False
+
+        async def send_with_etag(message: Message) -> None:
+            nonlocal passthrough
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if (
+                    message["status"] != 200
+                    or "etag" in headers
+                    or not headers.get("content-type", "").startswith("application/json")
+                ):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start.update(message)
+                return
+
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            # Hold the body until it is complete so it can be hashed
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(chunks)
+            etag = weak_etag(body)
+            headers = MutableHeaders(raw=list(start["headers"]))
+            headers["ETag"] = etag
+
+            if etag_matches(Request(scope), etag):
+                del headers["content-length"]
+                del headers["content-type"]
+                start["status"] = 304
+                body = b""
+
+            start["headers"] = headers.raw
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_with_etag)
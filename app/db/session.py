@@ -1,11 +1,41 @@
+import asyncio
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import NullPool
 from app.core.config import settings
 
+# Pool settings (PgBouncer does its own pooling, so skip ours there)
+if settings.DB_USE_NULL_POOL:
+    pool_kwargs = {"poolclass": NullPool}
+else:
+    pool_kwargs = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": True,
+    }
+
+connect_args = {}
+if settings.async_database_url.startswith("postgresql+asyncpg"):
+    # PgBouncer in transaction mode can't keep prepared statements per client
+    statement_cache_size = 0 if settings.DB_USE_NULL_POOL else settings.DB_STATEMENT_CACHE_SIZE
+    connect_args = {
+        "statement_cache_size": statement_cache_size,  # asyncpg's own cache
+        "prepared_statement_cache_size": statement_cache_size,  # SQLAlchemy adapter's cache
+        "server_settings": {"application_name": settings.APP_NAME},
+    }
+    if settings.DB_DISABLE_JIT:
+        connect_args["server_settings"]["jit"] = "off"
+
 # Create async engine
 engine = create_async_engine(
     settings.async_database_url,
     echo=settings.DEBUG,
-    future=True
+    future=True,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    connect_args=connect_args,
+    **pool_kwargs
 )
 
 # Create async session factory
@@ -18,11 +48,33 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+async def _ping() -> None:
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+async def warm_up_pool() -> None:
+    """Open pooled connections at startup so early requests don't pay for them"""
+    if settings.DB_USE_NULL_POOL:
+        # Nothing is kept around, just make sure the database is reachable
+        await _ping()
+        return
+
+    # Held concurrently, so each ping checks out its own connection
+    count = max(1, min(settings.DB_POOL_PREWARM, settings.DB_POOL_SIZE))
+    await asyncio.gather(*(_ping() for _ in range(count)))
+
+
 async def get_db() -> AsyncSession:
+    # Resolved once per request: the auth dependencies and the service providers
+    # all receive this same session, so a request checks out one connection.
+    # Endpoints must go through Depends(get_db) rather than opening their own
+    # (the ndjson report stream is the exception, as it outlives this session).
+    # No implicit commit: services commit their own writes, and a read-only
+    # request just ends its transaction when the session closes
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            await session.commit()
         except Exception:
             await session.rollback()
             raise
@@ -1,9 +1,16 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.openapi.docs import get_redoc_html
+from fastapi.responses import ORJSONResponse
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
+import asyncio
+import os
 
 from app.core.config import settings
+from app.core.middleware import ETagMiddleware
+from app.db.session import engine, warm_up_pool
 from app.api.v1.router import api_router
 
 
@@ -12,9 +19,15 @@ async def lifespan(app: FastAPI):
     """Application lifespan events"""
     # Startup
     print(f"Starting {settings.APP_NAME}...")
+    # Bound the pool behind asyncio.to_thread (bcrypt, webhook signatures)
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 2))
+    )
+    await warm_up_pool()
     yield
     # Shutdown
     print(f"Shutting down {settings.APP_NAME}...")
+    await engine.dispose()
 
 
 app = FastAPI(
@@ -24,6 +37,7 @@ app = FastAPI(
     openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
     docs_url=f"{settings.API_V1_PREFIX}/docs",
     redoc_url=None,  # Disable default, we'll add custom one
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
@@ -37,13 +51,21 @@ async def redoc_html():
         redoc_js_url="https://unpkg.com/redoc@latest/bundles/redoc.standalone.js",
     )
 
+# Conditional GETs for JSON reads (runs inside gzip so it hashes the raw body)
+app.add_middleware(ETagMiddleware)
+
+# Compress larger JSON bodies (search results, hotel info, booking lists)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins_list,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type", "If-None-Match", "Idempotency-Key"],
+    expose_headers=["ETag"],
+    max_age=86400,  # Let browsers reuse preflight results for a day
 )
 
 # Include API router
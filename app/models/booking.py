@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Date, Float, Enum as SQLEnum, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Date, Numeric, Enum as SQLEnum, Text, Index, Select, select, FetchedValue
+from sqlalchemy.orm import relationship, selectinload, joinedload, raiseload
 from sqlalchemy.sql import func
 from app.db.base import Base
 from app.models.guest import booking_guests
@@ -21,14 +21,15 @@ class Booking(Base):
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     hotel_id = Column(Integer, ForeignKey("hotels.id", ondelete="CASCADE"), nullable=False)
-    room_id = Column(Integer, ForeignKey("rooms.id", ondelete="CASCADE"), nullable=False)
+    room_id = Column(Integer, ForeignKey("rooms.id", ondelete="CASCADE"), nullable=False, index=True)
 
-    check_in_date = Column(Date, nullable=False, index=True)
-    check_out_date = Column(Date, nullable=False, index=True)
+    check_in_date = Column(Date, nullable=False)
+    check_out_date = Column(Date, nullable=False)
     rooms_count = Column(Integer, nullable=False, default=1)  # Number of rooms booked
 
-    total_price = Column(Float, nullable=False)
-    status = Column(SQLEnum(BookingStatus), default=BookingStatus.PENDING, nullable=False)
+    total_price = Column(Numeric(12, 2), nullable=False)
+    # Native Postgres enum (4-byte values); the type name matches the initial migration
+    status = Column(SQLEnum(BookingStatus, name="bookingstatus", validate_strings=True), default=BookingStatus.PENDING, nullable=False)
 
     special_requests = Column(Text, nullable=True)
     cancellation_reason = Column(Text, nullable=True)
@@ -37,7 +38,18 @@ class Booking(Base):
     payment_session_id = Column(String(255), nullable=True)  # For payment gateway reference
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())
+
+    # Hotel booking lists (optionally by status), reports and "my bookings"
+    # filter by owner and sort by created_at
+    __table_args__ = (
+        Index("ix_bookings_hotel_id_created_at", "hotel_id", "created_at"),
+        Index("ix_bookings_hotel_id_status_created_at", "hotel_id", "status", "created_at"),
+        Index("ix_bookings_user_id_created_at", "user_id", "created_at"),
+    )
+
+    # Server-generated values (updated_at is set by a trigger) come back via RETURNING
+    __mapper_args__ = {"eager_defaults": True}
 
     # Relationships
     user = relationship("User", back_populates="bookings")
@@ -46,6 +58,21 @@ class Booking(Base):
     guests = relationship("Guest", secondary=booking_guests, back_populates="bookings")
     payment = relationship("Payment", back_populates="booking", uselist=False, cascade="all, delete-orphan")
 
+    @classmethod
+    def select_with_details(cls) -> Select:
+        """Select bookings with guests, hotel name and room name loaded in two queries"""
+        from app.models.hotel import Hotel
+        from app.models.room import Room
+
+        # Any other relationship access is a bug (an N+1 or a lazy load under
+        # asyncio), so make it raise instead of querying
+        return select(cls).options(
+            selectinload(cls.guests),
+            joinedload(cls.hotel).load_only(Hotel.name),
+            joinedload(cls.room).load_only(Room.name),
+            raiseload("*")
+        )
+
     @property
     def nights(self) -> int:
         """Calculate number of nights"""
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Enum as SQLEnum, Table
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Enum as SQLEnum, Table, Index, FetchedValue
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base import Base
@@ -16,7 +16,8 @@ booking_guests = Table(
     "booking_guests",
     Base.metadata,
     Column("booking_id", Integer, ForeignKey("bookings.id", ondelete="CASCADE"), primary_key=True),
-    Column("guest_id", Integer, ForeignKey("guests.id", ondelete="CASCADE"), primary_key=True)
+    # The primary key leads with booking_id; guest-side lookups and cascades need their own index
+    Column("guest_id", Integer, ForeignKey("guests.id", ondelete="CASCADE"), primary_key=True, index=True)
 )
 
 
@@ -28,10 +29,17 @@ class Guest(Base):
     name = Column(String(255), nullable=False)
     email = Column(String(255), nullable=True)
     phone = Column(String(20), nullable=True)
-    gender = Column(SQLEnum(Gender), nullable=True)
+    gender = Column(SQLEnum(Gender, name="gender", validate_strings=True), nullable=True)
     age = Column(Integer, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())
+
+    __table_args__ = (
+        Index("ix_guests_user_id_created_at", "user_id", "created_at"),
+    )
+
+    # Server-generated values (updated_at is set by a trigger) come back via RETURNING
+    __mapper_args__ = {"eager_defaults": True}
 
     # Relationships
     user = relationship("User", back_populates="guests")
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Float, JSON
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Float, Index, FetchedValue, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base import Base
@@ -8,22 +9,40 @@ class Hotel(Base):
     __tablename__ = "hotels"
 
     id = Column(Integer, primary_key=True, index=True)
-    owner_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    owner_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String(255), nullable=False, index=True)
     description = Column(Text, nullable=True)
     city = Column(String(100), nullable=False, index=True)
     address = Column(String(500), nullable=True)
     latitude = Column(Float, nullable=True)
     longitude = Column(Float, nullable=True)
-    amenities = Column(JSON, default=list)  # List of amenities
-    photos = Column(JSON, default=list)  # List of photo URLs
+    amenities = Column(JSONB, default=list)  # List of amenities
+    photos = Column(JSONB, default=list)  # List of photo URLs
     contact_email = Column(String(255), nullable=True)
     contact_phone = Column(String(20), nullable=True)
     is_active = Column(Boolean, default=False)  # Needs activation by admin
     rating = Column(Float, default=0.0)
     total_reviews = Column(Integer, default=0)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())
+
+    # Search lists active hotels by rating, filters amenities with @> and
+    # matches city with ILIKE '%...%' (trigram index, needs pg_trgm)
+    __table_args__ = (
+        Index("ix_hotels_is_active_rating", "is_active", "rating"),
+        Index(
+            "ix_hotels_amenities", "amenities",
+            postgresql_using="gin", postgresql_ops={"amenities": "jsonb_path_ops"}
+        ),
+        Index(
+            "ix_hotels_city_trgm", "city",
+            postgresql_using="gin", postgresql_ops={"city": "gin_trgm_ops"},
+            postgresql_where=text("is_active = true")
+        ),
+    )
+
+    # Server-generated values (updated_at is set by a trigger) come back via RETURNING
+    __mapper_args__ = {"eager_defaults": True}
 
     # Relationships
     owner = relationship("User", back_populates="hotels")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, Date, Float, UniqueConstraint
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Date, Numeric, UniqueConstraint, Index, Computed, FetchedValue
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base import Base
@@ -13,25 +13,26 @@ class Inventory(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     room_id = Column(Integer, ForeignKey("rooms.id", ondelete="CASCADE"), nullable=False)
-    date = Column(Date, nullable=False, index=True)
+    date = Column(Date, nullable=False)  # Lookups are always per room, served by uq_room_date
     available_count = Column(Integer, nullable=False)  # Rooms available on this date
     booked_count = Column(Integer, default=0)  # Rooms booked on this date
-    price = Column(Float, nullable=False)  # Price for this date (can vary)
+    # Rooms still free on this date, maintained by the database
+    remaining_count = Column(Integer, Computed("available_count - COALESCE(booked_count, 0)", persisted=True), nullable=False)
+    price = Column(Numeric(12, 2), nullable=False)  # Price for this date (can vary)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())
 
     # Unique constraint: one inventory record per room per date
     __table_args__ = (
         UniqueConstraint('room_id', 'date', name='uq_room_date'),
+        Index('ix_inventories_room_id_date_remaining_count', 'room_id', 'date', 'remaining_count'),
     )
 
+    # Fetch remaining_count and updated_at back with RETURNING instead of expiring them on write
+    __mapper_args__ = {"eager_defaults": True}
+
     # Relationships
     room = relationship("Room", back_populates="inventories")
 
-    @property
-    def remaining_count(self) -> int:
-        """Calculate remaining available rooms"""
-        return self.available_count - self.booked_count
-
     def __repr__(self):
         return f"<Inventory(room_id={self.room_id}, date={self.date}, available={self.remaining_count})>"
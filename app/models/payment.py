@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Float, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Numeric, Enum as SQLEnum, FetchedValue
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base import Base
@@ -26,19 +26,22 @@ class Payment(Base):
     id = Column(Integer, primary_key=True, index=True)
     booking_id = Column(Integer, ForeignKey("bookings.id", ondelete="CASCADE"), nullable=False, unique=True)
 
-    amount = Column(Float, nullable=False)
+    amount = Column(Numeric(12, 2), nullable=False)
     currency = Column(String(3), default="USD", nullable=False)
-    status = Column(SQLEnum(PaymentStatus), default=PaymentStatus.PENDING, nullable=False)
-    payment_method = Column(SQLEnum(PaymentMethod), nullable=True)
+    status = Column(SQLEnum(PaymentStatus, name="paymentstatus", validate_strings=True), default=PaymentStatus.PENDING, nullable=False)
+    payment_method = Column(SQLEnum(PaymentMethod, name="paymentmethod", validate_strings=True), nullable=True)
 
     # Payment gateway references (mock)
     transaction_id = Column(String(255), nullable=True, unique=True)
-    payment_session_id = Column(String(255), nullable=True)
+    payment_session_id = Column(String(255), nullable=True, index=True)
 
     # Timestamps
     paid_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())
+
+    # Server-generated values (updated_at is set by a trigger) come back via RETURNING
+    __mapper_args__ = {"eager_defaults": True}
 
     # Relationships
     booking = relationship("Booking", back_populates="payment")
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Float, JSON, Text, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Numeric, Text, Enum as SQLEnum, FetchedValue
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base import Base
@@ -17,17 +18,20 @@ class Room(Base):
     __tablename__ = "rooms"
 
     id = Column(Integer, primary_key=True, index=True)
-    hotel_id = Column(Integer, ForeignKey("hotels.id", ondelete="CASCADE"), nullable=False)
+    hotel_id = Column(Integer, ForeignKey("hotels.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
-    room_type = Column(SQLEnum(RoomType), nullable=False)
-    base_price = Column(Float, nullable=False)
+    room_type = Column(SQLEnum(RoomType, name="roomtype", validate_strings=True), nullable=False)
+    base_price = Column(Numeric(12, 2), nullable=False)
     total_count = Column(Integer, nullable=False, default=1)  # Total rooms of this type
     capacity = Column(Integer, nullable=False, default=2)  # Max guests
-    amenities = Column(JSON, default=list)
-    photos = Column(JSON, default=list)
+    amenities = Column(JSONB, default=list)
+    photos = Column(JSONB, default=list)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())
+
+    # Server-generated values (updated_at is set by a trigger) come back via RETURNING
+    __mapper_args__ = {"eager_defaults": True}
 
     # Relationships
     hotel = relationship("Hotel", back_populates="rooms")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum as SQLEnum, FetchedValue
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base import Base
@@ -19,15 +19,25 @@ class User(Base):
     hashed_password = Column(String(255), nullable=False)
     name = Column(String(255), nullable=False)
     phone = Column(String(20), nullable=True)
-    role = Column(SQLEnum(UserRole), default=UserRole.GUEST, nullable=False)
+    role = Column(SQLEnum(UserRole, name="userrole", validate_strings=True), default=UserRole.GUEST, nullable=False)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())
+
+    # Server-generated values (updated_at is set by a trigger) come back via RETURNING
+    __mapper_args__ = {"eager_defaults": True}
 
     # Relationships
     guests = relationship("Guest", back_populates="user", cascade="all, delete-orphan")
     bookings = relationship("Booking", back_populates="user", cascade="all, delete-orphan")
     hotels = relationship("Hotel", back_populates="owner", cascade="all, delete-orphan")
 
+    # Ids of owned hotels, preloaded per request by get_current_hotel_admin
+    hotel_ids = None
+
+    def owns_hotel(self, hotel_id: int) -> bool:
+        """Check ownership against the preloaded hotel ids (no query)"""
+        return self.hotel_ids is not None and hotel_id in self.hotel_ids
+
     def __repr__(self):
         return f"<User(id={self.id}, email={self.email}, role={self.role})>"
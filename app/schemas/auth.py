@@ -1,10 +1,11 @@
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, Field
 from typing import Optional
 from app.models.user import UserRole
+from app.schemas.types import Email
 
 
 class SignupRequest(BaseModel):
-    email: EmailStr
+    email: Email
     password: str = Field(..., min_length=6, max_length=100)
     name: str = Field(..., min_length=1, max_length=255)
     phone: Optional[str] = Field(None, max_length=20)
@@ -12,7 +13,7 @@ class SignupRequest(BaseModel):
 
 
 class LoginRequest(BaseModel):
-    email: EmailStr
+    email: Email
     password: str
 
 
@@ -1,8 +1,9 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from typing import Optional, List
 from datetime import date, datetime
 from app.models.booking import BookingStatus
 from app.schemas.guest import GuestResponse
+from app.schemas.types import Money
 
 
 class BookingBase(BaseModel):
@@ -32,15 +33,14 @@ class BookingCancel(BaseModel):
 class BookingResponse(BookingBase):
     id: int
     user_id: int
-    total_price: float
+    total_price: Money
     status: BookingStatus
     cancellation_reason: Optional[str] = None
     payment_session_id: Optional[str] = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class BookingDetailResponse(BookingResponse):
@@ -50,6 +50,33 @@ class BookingDetailResponse(BookingResponse):
     room_name: Optional[str] = None
 
 
+def booking_detail_row(booking) -> dict:
+    """Flatten a Booking with loaded relationships into BookingDetailResponse input"""
+    return {
+        "id": booking.id,
+        "user_id": booking.user_id,
+        "hotel_id": booking.hotel_id,
+        "room_id": booking.room_id,
+        "check_in_date": booking.check_in_date,
+        "check_out_date": booking.check_out_date,
+        "rooms_count": booking.rooms_count,
+        "total_price": booking.total_price,
+        "status": booking.status,
+        "special_requests": booking.special_requests,
+        "cancellation_reason": booking.cancellation_reason,
+        "payment_session_id": booking.payment_session_id,
+        "created_at": booking.created_at,
+        "updated_at": booking.updated_at,
+        "guests": booking.guests,
+        "hotel_name": booking.hotel.name if booking.hotel else None,
+        "room_name": booking.room.name if booking.room else None,
+    }
+
+
+# Validates a whole page of booking rows in one pydantic-core call
+booking_details_adapter = TypeAdapter(List[BookingDetailResponse])
+
+
 class BookingListResponse(BaseModel):
     bookings: List[BookingDetailResponse]
     total: int
@@ -71,8 +98,8 @@ class HotelBookingReport(BaseModel):
     confirmed_bookings: int
     cancelled_bookings: int
     pending_bookings: int
-    total_revenue: float
-    average_booking_value: float
+    total_revenue: Money
+    average_booking_value: Money
     occupancy_rate: float
     report_period_start: date
     report_period_end: date
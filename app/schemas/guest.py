@@ -1,12 +1,13 @@
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 from datetime import datetime
 from app.models.guest import Gender
+from app.schemas.types import ContactEmail
 
 
 class GuestBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=255)
-    email: Optional[EmailStr] = None
+    email: Optional[ContactEmail] = None
     phone: Optional[str] = Field(None, max_length=20)
     gender: Optional[Gender] = None
     age: Optional[int] = Field(None, ge=0, le=150)
@@ -18,7 +19,7 @@ class GuestCreate(GuestBase):
 
 class GuestUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=255)
-    email: Optional[EmailStr] = None
+    email: Optional[ContactEmail] = None
     phone: Optional[str] = Field(None, max_length=20)
     gender: Optional[Gender] = None
     age: Optional[int] = Field(None, ge=0, le=150)
@@ -30,10 +31,11 @@ class GuestResponse(GuestBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class GuestListResponse(BaseModel):
     guests: List[GuestResponse]
     total: int
+    page: int
+    page_size: int
@@ -1,6 +1,7 @@
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from typing import Optional, List
 from datetime import datetime
+from app.schemas.types import ContactEmail
 
 
 class HotelBase(BaseModel):
@@ -12,7 +13,7 @@ class HotelBase(BaseModel):
     longitude: Optional[float] = Field(None, ge=-180, le=180)
     amenities: List[str] = []
     photos: List[str] = []
-    contact_email: Optional[EmailStr] = None
+    contact_email: Optional[ContactEmail] = None
     contact_phone: Optional[str] = Field(None, max_length=20)
 
 
@@ -29,7 +30,7 @@ class HotelUpdate(BaseModel):
     longitude: Optional[float] = Field(None, ge=-180, le=180)
     amenities: Optional[List[str]] = None
     photos: Optional[List[str]] = None
-    contact_email: Optional[EmailStr] = None
+    contact_email: Optional[ContactEmail] = None
     contact_phone: Optional[str] = Field(None, max_length=20)
 
 
@@ -42,8 +43,7 @@ class HotelResponse(HotelBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class HotelListResponse(BaseModel):
@@ -53,6 +53,10 @@ class HotelListResponse(BaseModel):
     page_size: int
 
 
+# Validates a page of Hotel rows in one pydantic-core call
+hotels_adapter = TypeAdapter(List[HotelResponse])
+
+
 class HotelSearchParams(BaseModel):
     city: Optional[str] = None
     check_in_date: Optional[str] = None  # YYYY-MM-DD
@@ -1,12 +1,13 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 from datetime import date, datetime
+from app.schemas.types import Money
 
 
 class InventoryBase(BaseModel):
     date: date
     available_count: int = Field(..., ge=0)
-    price: float = Field(..., gt=0)
+    price: Money = Field(..., gt=0)
 
 
 class InventoryCreate(InventoryBase):
@@ -15,7 +16,7 @@ class InventoryCreate(InventoryBase):
 
 class InventoryUpdate(BaseModel):
     available_count: Optional[int] = Field(None, ge=0)
-    price: Optional[float] = Field(None, gt=0)
+    price: Optional[Money] = Field(None, gt=0)
 
 
 class InventoryBulkUpdate(BaseModel):
@@ -23,7 +24,7 @@ class InventoryBulkUpdate(BaseModel):
     start_date: date
     end_date: date
     available_count: Optional[int] = Field(None, ge=0)
-    price: Optional[float] = Field(None, gt=0)
+    price: Optional[Money] = Field(None, gt=0)
 
 
 class InventoryResponse(InventoryBase):
@@ -33,8 +34,7 @@ class InventoryResponse(InventoryBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
     @property
     def remaining_count(self) -> int:
@@ -1,7 +1,8 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 from datetime import datetime
 from app.models.payment import PaymentStatus, PaymentMethod
+from app.schemas.types import Money
 
 
 class PaymentInitiate(BaseModel):
@@ -12,7 +13,7 @@ class PaymentInitiate(BaseModel):
 class PaymentResponse(BaseModel):
     id: int
     booking_id: int
-    amount: float
+    amount: Money
     currency: str
     status: PaymentStatus
     payment_method: Optional[PaymentMethod] = None
@@ -22,8 +23,7 @@ class PaymentResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PaymentWebhookPayload(BaseModel):
@@ -31,7 +31,7 @@ class PaymentWebhookPayload(BaseModel):
     payment_session_id: str
     transaction_id: str
     status: str  # "success" or "failed"
-    amount: float
+    amount: Money
     currency: str = "USD"
 
 
@@ -39,6 +39,6 @@ class PaymentSessionResponse(BaseModel):
     """Response when initiating payment"""
     payment_session_id: str
     payment_url: str  # Mock URL for payment
-    amount: float
+    amount: Money
     currency: str
     expires_at: datetime
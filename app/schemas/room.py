@@ -1,14 +1,16 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 from datetime import datetime
+from decimal import Decimal
 from app.models.room import RoomType
+from app.schemas.types import Money
 
 
 class RoomBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=255)
     description: Optional[str] = None
     room_type: RoomType
-    base_price: float = Field(..., gt=0)
+    base_price: Money = Field(..., gt=0)
     total_count: int = Field(..., ge=1)
     capacity: int = Field(..., ge=1)
     amenities: List[str] = []
@@ -23,7 +25,7 @@ class RoomUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=255)
     description: Optional[str] = None
     room_type: Optional[RoomType] = None
-    base_price: Optional[float] = Field(None, gt=0)
+    base_price: Optional[Money] = Field(None, gt=0)
     total_count: Optional[int] = Field(None, ge=1)
     capacity: Optional[int] = Field(None, ge=1)
     amenities: Optional[List[str]] = None
@@ -36,8 +38,7 @@ class RoomResponse(RoomBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class RoomListResponse(BaseModel):
@@ -48,5 +49,5 @@ class RoomListResponse(BaseModel):
 class RoomAvailabilityResponse(RoomResponse):
     """Room with availability info for a date range"""
     available_count: int = 0
-    price_per_night: float = 0.0
-    total_price: float = 0.0
+    price_per_night: Money = Decimal(0)
+    total_price: Money = Decimal(0)
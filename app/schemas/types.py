@@ -0,0 +1,33 @@
+from decimal import Decimal
+import re
+from typing import Annotated
+
+from pydantic import AfterValidator, PlainSerializer
+
+# Money is held as Decimal (NUMERIC(12, 2) in the database) but stays a JSON
+# number on the wire so API clients see the same shape as before.
+Money = Annotated[Decimal, PlainSerializer(float, return_type=float, when_used="json")]
+
+# Pragmatic shape check; email-validator's IDNA/DNS-syntax pass is far slower
+# and buys little when addresses are confirmed out of band anyway.
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def _normalize_email(value: str) -> str:
+    value = value.strip().lower()
+    if len(value) > 255 or not EMAIL_RE.match(value):
+        raise ValueError("value is not a valid email address")
+    return value
+
+
+def _check_email(value: str) -> str:
+    if len(value) > 255 or not EMAIL_RE.match(value):
+        raise ValueError("value is not a valid email address")
+    return value
+
+
+# Account emails: stored lowercased, so lookups by email are case-insensitive without LOWER()
+Email = Annotated[str, AfterValidator(_normalize_email)]
+
+# Contact details (guests, hotels) are never looked up, so they keep the case they were sent in
+ContactEmail = Annotated[str, AfterValidator(_check_email)]
@@ -1,9 +1,12 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, lambda_stmt
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from fastapi import HTTPException, status
+import asyncio
 
 from app.models.user import User, UserRole
 from app.schemas.auth import SignupRequest, LoginRequest, TokenResponse
+from app.core.cache import user_cache
 from app.core.security import (
     get_password_hash,
     verify_password,
@@ -12,6 +15,9 @@ from app.core.security import (
     decode_token,
 )
 
+# Verified against when the email is unknown, so a miss costs as much as a wrong password
+_DUMMY_HASH = get_password_hash("unused-dummy-password-for-timing")
+
 
 class AuthService:
     def __init__(self, db: AsyncSession):
@@ -19,42 +25,45 @@ class AuthService:
 
     async def signup(self, request: SignupRequest) -> User:
         """Register a new user"""
-        # Check if email already exists
+        # bcrypt is slow and CPU-bound, keep it off the event loop
+        hashed_password = await asyncio.to_thread(get_password_hash, request.password)
+
+        # The unique email index decides, so concurrent signups can't both
+        # pass a separate existence check
         result = await self.db.execute(
-            select(User).where(User.email == request.email)
+            pg_insert(User)
+            .values(
+                email=request.email,
+                hashed_password=hashed_password,
+                name=request.name,
+                phone=request.phone,
+                role=request.role,
+            )
+            .on_conflict_do_nothing(index_elements=["email"])
+            .returning(User)
         )
-        existing_user = result.scalar_one_or_none()
+        user = result.scalar_one_or_none()
 
-        if existing_user:
+        if user is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered"
             )
 
-        # Create new user
-        user = User(
-            email=request.email,
-            hashed_password=get_password_hash(request.password),
-            name=request.name,
-            phone=request.phone,
-            role=request.role,
-        )
-
-        self.db.add(user)
-        await self.db.flush()
-        await self.db.refresh(user)
+        await self.db.commit()
 
         return user
 
     async def login(self, request: LoginRequest) -> TokenResponse:
         """Authenticate user and return tokens"""
         # Find user by email
-        result = await self.db.execute(
-            select(User).where(User.email == request.email)
-        )
+        result = await self.db.execute(self._user_by_email(request.email))
         user = result.scalar_one_or_none()
 
-        if not user or not verify_password(request.password, user.hashed_password):
+        # Always run one bcrypt verification so response time doesn't reveal whether the email exists
+        hashed_password = user.hashed_password if user else _DUMMY_HASH
+        password_ok = await asyncio.to_thread(verify_password, request.password, hashed_password)
+        if not user or not password_ok:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid email or password"
@@ -77,7 +86,7 @@ class AuthService:
 
     async def refresh_token(self, refresh_token: str) -> TokenResponse:
         """Refresh access token using refresh token"""
-        payload = decode_token(refresh_token)
+        payload = await asyncio.to_thread(decode_token, refresh_token)
 
         if payload is None:
             raise HTTPException(
@@ -98,11 +107,9 @@ class AuthService:
                 detail="Invalid token payload"
             )
 
-        # Verify user still exists and is active
-        result = await self.db.execute(
-            select(User).where(User.id == int(user_id))
-        )
-        user = result.scalar_one_or_none()
+        # Verify user still exists and is active, from the snapshot
+        # get_current_user keeps when there is one
+        user = user_cache.get(int(user_id)) or await self.db.get(User, int(user_id))
 
         if not user:
             raise HTTPException(
@@ -124,3 +131,8 @@ class AuthService:
             access_token=new_access_token,
             refresh_token=new_refresh_token,
         )
+
+    @staticmethod
+    def _user_by_email(email: str):
+        """User lookup by email, compiled once and reused for every login"""
+        return lambda_stmt(lambda: select(User).where(User.email == email))
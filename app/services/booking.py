@@ -1,18 +1,30 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, update, case, func, and_, lambda_stmt
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy.orm.attributes import set_committed_value
 from fastapi import HTTPException, status
 from typing import List, Optional
 from datetime import date, timedelta
+from decimal import Decimal
 
 from app.models.booking import Booking, BookingStatus
-from app.models.hotel import Hotel
 from app.models.room import Room
 from app.models.inventory import Inventory
-from app.models.guest import Guest
+from app.models.guest import booking_guests
 from app.models.payment import Payment, PaymentStatus
 from app.models.user import User, UserRole
-from app.schemas.booking import BookingCreate, BookingAddGuests, BookingCancel
+from app.schemas.booking import (
+    BookingCreate,
+    BookingAddGuests,
+    BookingCancel,
+    BookingListResponse,
+    booking_detail_row,
+    booking_details_adapter,
+)
+from app.services.guest import GuestService
+from app.services.hotel import HotelService
+from app.core.cache import booking_status_cache, hotel_search_cache
 
 
 class BookingService:
@@ -35,11 +47,8 @@ class BookingService:
             )
 
         # Verify hotel exists and is active
-        hotel_result = await self.db.execute(
-            select(Hotel).where(Hotel.id == booking_data.hotel_id, Hotel.is_active == True)
-        )
-        hotel = hotel_result.scalar_one_or_none()
-        if not hotel:
+        hotel = await HotelService(self.db).get_hotel_meta(booking_data.hotel_id)
+        if not hotel or not hotel.is_active:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Hotel not found or not active"
@@ -59,19 +68,27 @@ class BookingService:
                 detail="Room not found in this hotel"
             )
 
-        # Check availability for all dates
+        # Check availability for all dates, fetching the whole stay in one query.
+        # The rows stay locked until commit so concurrent bookings can't both
+        # pass the check and oversell; locking in date order avoids deadlocks.
         nights = (booking_data.check_out_date - booking_data.check_in_date).days
-        total_price = 0.0
+        total_price = Decimal(0)
+
+        inv_result = await self.db.execute(
+            select(Inventory)
+            .where(
+                Inventory.room_id == room.id,
+                Inventory.date >= booking_data.check_in_date,
+                Inventory.date < booking_data.check_out_date
+            )
+            .order_by(Inventory.date)
+            .with_for_update()
+        )
+        inv_by_date = {inv.date: inv for inv in inv_result.scalars()}
 
         for i in range(nights):
             inv_date = booking_data.check_in_date + timedelta(days=i)
-            inv_result = await self.db.execute(
-                select(Inventory).where(
-                    Inventory.room_id == room.id,
-                    Inventory.date == inv_date
-                )
-            )
-            inventory = inv_result.scalar_one_or_none()
+            inventory = inv_by_date.get(inv_date)
 
             if not inventory:
                 raise HTTPException(
@@ -79,8 +96,7 @@ class BookingService:
                     detail=f"No inventory available for date {inv_date}"
                 )
 
-            available = inventory.available_count - inventory.booked_count
-            if available < booking_data.rooms_count:
+            if inventory.remaining_count < booking_data.rooms_count:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Not enough rooms available for date {inv_date}"
@@ -103,48 +119,44 @@ class BookingService:
 
         self.db.add(booking)
         await self.db.flush()
-        await self.db.refresh(booking)
 
         # Reserve inventory (update booked_count)
         await self._reserve_inventory(booking)
+        await self.db.commit()
+        # Search filters on availability, which booked_count just changed
+        hotel_search_cache.clear()
 
         return booking
 
     async def _reserve_inventory(self, booking: Booking):
         """Reserve inventory for a booking"""
-        nights = (booking.check_out_date - booking.check_in_date).days
-
-        for i in range(nights):
-            inv_date = booking.check_in_date + timedelta(days=i)
-            inv_result = await self.db.execute(
-                select(Inventory).where(
-                    Inventory.room_id == booking.room_id,
-                    Inventory.date == inv_date
-                )
-            )
-            inventory = inv_result.scalar_one_or_none()
-            if inventory:
-                inventory.booked_count += booking.rooms_count
-
-        await self.db.flush()
+        # One UPDATE for the whole stay instead of loading and flushing each night
+        await self.db.execute(
+            update(Inventory)
+            .where(*self._stay_criteria(booking))
+            .values(booked_count=Inventory.booked_count + booking.rooms_count)
+        )
 
     async def _release_inventory(self, booking: Booking):
         """Release inventory when booking is cancelled"""
-        nights = (booking.check_out_date - booking.check_in_date).days
-
-        for i in range(nights):
-            inv_date = booking.check_in_date + timedelta(days=i)
-            inv_result = await self.db.execute(
-                select(Inventory).where(
-                    Inventory.room_id == booking.room_id,
-                    Inventory.date == inv_date
-                )
-            )
-            inventory = inv_result.scalar_one_or_none()
-            if inventory:
-                inventory.booked_count = max(0, inventory.booked_count - booking.rooms_count)
+        rooms_count = booking.rooms_count
+        await self.db.execute(
+            update(Inventory)
+            .where(*self._stay_criteria(booking))
+            .values(booked_count=case(
+                (Inventory.booked_count >= rooms_count, Inventory.booked_count - rooms_count),
+                else_=0
+            ))
+        )
 
-        await self.db.flush()
+    @staticmethod
+    def _stay_criteria(booking: Booking) -> tuple:
+        """Filter for the inventory rows covering a booking's nights"""
+        return (
+            Inventory.room_id == booking.room_id,
+            Inventory.date >= booking.check_in_date,
+            Inventory.date < booking.check_out_date,
+        )
 
     async def get_booking_by_id(self, booking_id: int, user: User) -> Booking:
         """Get booking by ID with ownership check"""
@@ -152,13 +164,14 @@ class BookingService:
             select(Booking)
             .where(Booking.id == booking_id)
             .options(
-                selectinload(Booking.hotel),
-                selectinload(Booking.room),
-                selectinload(Booking.guests),
-                selectinload(Booking.payment)
+                # Single-row relationships come back joined with the booking itself
+                joinedload(Booking.hotel),
+                joinedload(Booking.room),
+                joinedload(Booking.payment),
+                selectinload(Booking.guests)
             )
         )
-        booking = result.scalar_one_or_none()
+        booking = result.unique().scalar_one_or_none()
 
         if not booking:
             raise HTTPException(
@@ -168,12 +181,8 @@ class BookingService:
 
         # Check ownership (user owns booking or is hotel admin/admin)
         if booking.user_id != user.id:
-            # Check if user is hotel admin
-            hotel_result = await self.db.execute(
-                select(Hotel).where(Hotel.id == booking.hotel_id)
-            )
-            hotel = hotel_result.scalar_one_or_none()
-
+            # Check if user is hotel admin (the hotel was loaded with the booking)
+            hotel = booking.hotel
             if user.role != UserRole.ADMIN and (not hotel or hotel.owner_id != user.id):
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
@@ -197,40 +206,54 @@ class BookingService:
                 detail="Cannot add guests to this booking"
             )
 
-        # Get guests
-        guest_result = await self.db.execute(
-            select(Guest).where(
-                Guest.id.in_(guest_data.guest_ids),
-                Guest.user_id == user.id
-            )
-        )
-        guests = guest_result.scalars().all()
+        if not guest_data.guest_ids:
+            return booking
 
-        if len(guests) != len(guest_data.guest_ids):
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Some guests not found"
-            )
+        # Get guests (404s on any id the user doesn't own)
+        guests = await GuestService(self.db).get_guests_by_ids(user, guest_data.guest_ids)
 
-        # Add guests to booking
-        booking.guests.extend(guests)
-        await self.db.flush()
-        await self.db.refresh(booking)
+        # One multi-row INSERT into the junction table; guests already on the
+        # booking are skipped by the primary key
+        await self.db.execute(
+            pg_insert(booking_guests)
+            .values([{"booking_id": booking.id, "guest_id": g.id} for g in guests])
+            .on_conflict_do_nothing()
+        )
+        await self.db.commit()
+
+        # Bring the loaded collection in line without the ORM writing it again
+        new_guests = [g for g in guests if g not in booking.guests]
+        set_committed_value(booking, "guests", list(booking.guests) + new_guests)
 
         return booking
 
     async def get_booking_status(self, booking_id: int, user: User):
         """Get booking status"""
-        booking = await self.get_booking_by_id(booking_id, user)
-
-        payment_status = None
-        if booking.payment:
-            payment_status = booking.payment.status.value
+        # Clients poll this during checkout; repeat polls skip the database
+        cached = booking_status_cache.get(booking_id)
+        if cached is None:
+            booking = await self.get_booking_by_id(booking_id, user)
+            cached = {
+                "status": booking.status,
+                "payment_status": booking.payment.status.value if booking.payment else None,
+                "user_id": booking.user_id,
+                "owner_id": booking.hotel.owner_id if booking.hotel else None,
+            }
+            booking_status_cache[booking_id] = cached
+        elif (
+            cached["user_id"] != user.id
+            and user.role != UserRole.ADMIN
+            and cached["owner_id"] != user.id
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not authorized to access this booking"
+            )
 
         return {
-            "booking_id": booking.id,
-            "status": booking.status,
-            "payment_status": payment_status
+            "booking_id": booking_id,
+            "status": cached["status"],
+            "payment_status": cached["payment_status"]
         }
 
     async def cancel_booking(
@@ -259,8 +282,9 @@ class BookingService:
         if booking.payment and booking.payment.status == PaymentStatus.COMPLETED:
             booking.payment.status = PaymentStatus.REFUNDED
 
-        await self.db.flush()
-        await self.db.refresh(booking)
+        await self.db.commit()
+        booking_status_cache.pop(booking.id, None)
+        hotel_search_cache.clear()
 
         return booking
 
@@ -271,59 +295,65 @@ class BookingService:
         page: int = 1,
         page_size: int = 10,
         status_filter: Optional[BookingStatus] = None
-    ):
+    ) -> BookingListResponse:
         """Get all bookings for a hotel (admin)"""
-        # Verify hotel access
-        hotel_result = await self.db.execute(
-            select(Hotel).where(Hotel.id == hotel_id)
-        )
-        hotel = hotel_result.scalar_one_or_none()
+        # Verify hotel access (owners are already known from the auth dependency)
+        if not user.owns_hotel(hotel_id):
+            hotel = await HotelService(self.db).get_hotel_meta(hotel_id)
 
-        if not hotel:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Hotel not found"
-            )
+            if not hotel:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Hotel not found"
+                )
 
-        if user.role != UserRole.ADMIN and hotel.owner_id != user.id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to access this hotel's bookings"
-            )
+            if user.role != UserRole.ADMIN and hotel.owner_id != user.id:
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="Not authorized to access this hotel's bookings"
+                )
 
         offset = (page - 1) * page_size
 
-        # Build query
-        query = select(Booking).where(Booking.hotel_id == hotel_id)
-        count_query = select(func.count(Booking.id)).where(Booking.hotel_id == hotel_id)
-
+        # Build query (lambda statements are compiled once and cached). The
+        # window count rides along with the page, so no separate COUNT query.
+        query = lambda_stmt(lambda: (
+            Booking.select_with_details()
+            .add_columns(func.count().over().label("total"))
+            .where(Booking.hotel_id == hotel_id)
+        ))
         if status_filter:
-            query = query.where(Booking.status == status_filter)
-            count_query = count_query.where(Booking.status == status_filter)
-
-        # Get total count
-        count_result = await self.db.execute(count_query)
-        total = count_result.scalar()
-
-        # Get paginated bookings
-        result = await self.db.execute(
-            query.options(
-                selectinload(Booking.user),
-                selectinload(Booking.room),
-                selectinload(Booking.guests)
-            )
-            .order_by(Booking.created_at.desc())
+            query += lambda s: s.where(Booking.status == status_filter)
+        query += lambda s: (
+            s.order_by(Booking.created_at.desc())
             .offset(offset)
             .limit(page_size)
         )
-        bookings = result.scalars().all()
-
-        return {
-            "bookings": bookings,
-            "total": total,
-            "page": page,
-            "page_size": page_size
-        }
+        result = await self.db.execute(query)
+        rows = result.all()
+        bookings = [row.Booking for row in rows]
+
+        if rows:
+            total = rows[0].total
+        elif page > 1:
+            # Past the last page there are no rows to carry the count
+            count_query = lambda_stmt(lambda: select(func.count(Booking.id)).where(Booking.hotel_id == hotel_id))
+            if status_filter:
+                count_query += lambda s: s.where(Booking.status == status_filter)
+            count_result = await self.db.execute(count_query)
+            total = count_result.scalar()
+        else:
+            total = 0
+
+        # Rows were validated by the adapter, so the envelope can skip validation
+        return BookingListResponse.model_construct(
+            bookings=booking_details_adapter.validate_python(
+                [booking_detail_row(b) for b in bookings]
+            ),
+            total=total,
+            page=page,
+            page_size=page_size
+        )
 
     async def get_hotel_report(
         self,
@@ -334,10 +364,7 @@ class BookingService:
     ):
         """Generate booking report for a hotel"""
         # Verify hotel access
-        hotel_result = await self.db.execute(
-            select(Hotel).where(Hotel.id == hotel_id)
-        )
-        hotel = hotel_result.scalar_one_or_none()
+        hotel = await HotelService(self.db).get_hotel_meta(hotel_id)
 
         if not hotel:
             raise HTTPException(
@@ -357,45 +384,48 @@ class BookingService:
         if not start_date:
             start_date = end_date - timedelta(days=30)
 
-        # Get all bookings in date range
-        result = await self.db.execute(
-            select(Booking).where(
-                Booking.hotel_id == hotel_id,
-                Booking.created_at >= start_date,
-                Booking.created_at <= end_date + timedelta(days=1)
-            )
+        # Aggregate in the database; only one row comes back however long the period.
+        # The hotel's room capacity rides along as a scalar subquery.
+        earning = Booking.status.in_(
+            [BookingStatus.CONFIRMED, BookingStatus.CHECKED_IN, BookingStatus.CHECKED_OUT]
         )
-        bookings = result.scalars().all()
-
-        # Calculate statistics
-        total_bookings = len(bookings)
-        confirmed_bookings = len([b for b in bookings if b.status == BookingStatus.CONFIRMED])
-        cancelled_bookings = len([b for b in bookings if b.status == BookingStatus.CANCELLED])
-        pending_bookings = len([b for b in bookings if b.status == BookingStatus.PENDING])
-
-        total_revenue = sum(
-            b.total_price for b in bookings
-            if b.status in [BookingStatus.CONFIRMED, BookingStatus.CHECKED_IN, BookingStatus.CHECKED_OUT]
+        total_rooms_subq = (
+            select(func.coalesce(func.sum(Room.total_count), 0))
+            .where(Room.hotel_id == hotel_id)
+            .scalar_subquery()
         )
-
-        average_booking_value = total_revenue / confirmed_bookings if confirmed_bookings > 0 else 0
-
-        # Calculate occupancy rate (simplified)
-        # Get total room capacity for the hotel
-        room_result = await self.db.execute(
-            select(func.sum(Room.total_count)).where(Room.hotel_id == hotel_id)
+        totals_result = await self.db.execute(
+            select(
+                func.count(Booking.id),
+                func.count(Booking.id).filter(Booking.status == BookingStatus.CONFIRMED),
+                func.count(Booking.id).filter(Booking.status == BookingStatus.CANCELLED),
+                func.count(Booking.id).filter(Booking.status == BookingStatus.PENDING),
+                func.coalesce(func.sum(Booking.total_price).filter(earning), 0),
+                func.coalesce(func.sum(
+                    Booking.rooms_count * (Booking.check_out_date - Booking.check_in_date)
+                ).filter(earning), 0),
+                total_rooms_subq,
+            ).where(*self._report_criteria(hotel_id, start_date, end_date))
+        )
+        (
+            total_bookings,
+            confirmed_bookings,
+            cancelled_bookings,
+            pending_bookings,
+            total_revenue,
+            booked_room_nights,
+            total_rooms,
+        ) = totals_result.one()
+
+        average_booking_value = (
+            (total_revenue / confirmed_bookings).quantize(Decimal("0.01"))
+            if confirmed_bookings > 0 else Decimal(0)
         )
-        total_rooms = room_result.scalar() or 0
 
+        # Calculate occupancy rate (simplified)
         days_in_period = (end_date - start_date).days + 1
         total_room_nights = total_rooms * days_in_period
 
-        booked_room_nights = sum(
-            b.rooms_count * (b.check_out_date - b.check_in_date).days
-            for b in bookings
-            if b.status in [BookingStatus.CONFIRMED, BookingStatus.CHECKED_IN, BookingStatus.CHECKED_OUT]
-        )
-
         occupancy_rate = (booked_room_nights / total_room_nights * 100) if total_room_nights > 0 else 0
 
         return {
@@ -411,3 +441,35 @@ class BookingService:
             "report_period_start": start_date,
             "report_period_end": end_date
         }
+
+    async def stream_report_rows(self, hotel_id: int, start_date: date, end_date: date):
+        """Yield the bookings behind a hotel report one row at a time"""
+        # Plain column rows (no ORM objects or identity map), pulled from the
+        # server-side cursor in fixed-size batches
+        result = await self.db.stream(
+            select(
+                Booking.id,
+                Booking.user_id,
+                Booking.room_id,
+                Booking.check_in_date,
+                Booking.check_out_date,
+                Booking.rooms_count,
+                Booking.total_price,
+                Booking.status,
+                Booking.created_at,
+            )
+            .where(*self._report_criteria(hotel_id, start_date, end_date))
+            .order_by(Booking.created_at)
+            .execution_options(yield_per=1000)
+        )
+        async for row in result.mappings():
+            yield dict(row)
+
+    @staticmethod
+    def _report_criteria(hotel_id: int, start_date: date, end_date: date) -> tuple:
+        """Filter for bookings created within a report period"""
+        return (
+            Booking.hotel_id == hotel_id,
+            Booking.created_at >= start_date,
+            Booking.created_at <= end_date + timedelta(days=1),
+        )
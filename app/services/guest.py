@@ -1,5 +1,5 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func, lambda_stmt
 from fastapi import HTTPException, status
 from typing import List
 
@@ -24,19 +24,41 @@ class GuestService:
         )
 
         self.db.add(guest)
-        await self.db.flush()
-        await self.db.refresh(guest)
+        await self.db.commit()
 
         return guest
 
-    async def get_guests(self, user: User) -> List[Guest]:
-        """Get all guests for the user"""
+    async def get_guests(self, user: User, page: int = 1, page_size: int = 100):
+        """Get the user's guests with pagination"""
+        offset = (page - 1) * page_size
+
+        # Window count rides along with the page, so no separate COUNT query
         result = await self.db.execute(
-            select(Guest)
+            select(Guest, func.count().over().label("total"))
             .where(Guest.user_id == user.id)
             .order_by(Guest.created_at.desc())
+            .offset(offset)
+            .limit(page_size)
         )
-        return result.scalars().all()
+        rows = result.all()
+
+        if rows:
+            total = rows[0].total
+        elif page > 1:
+            # Past the last page there are no rows to carry the count
+            count_result = await self.db.execute(
+                select(func.count()).select_from(Guest).where(Guest.user_id == user.id)
+            )
+            total = count_result.scalar_one()
+        else:
+            total = 0
+
+        return {
+            "guests": [row.Guest for row in rows],
+            "total": total,
+            "page": page,
+            "page_size": page_size
+        }
 
     async def get_guest_by_id(self, user: User, guest_id: int) -> Guest:
         """Get a specific guest by ID"""
@@ -67,8 +89,7 @@ class GuestService:
         for field, value in update_dict.items():
             setattr(guest, field, value)
 
-        await self.db.flush()
-        await self.db.refresh(guest)
+        await self.db.commit()
 
         return guest
 
@@ -76,19 +97,23 @@ class GuestService:
         """Delete a guest"""
         guest = await self.get_guest_by_id(user, guest_id)
         await self.db.delete(guest)
-        await self.db.flush()
+        await self.db.commit()
 
     async def get_guests_by_ids(self, user: User, guest_ids: List[int]) -> List[Guest]:
         """Get multiple guests by IDs (for booking)"""
-        result = await self.db.execute(
-            select(Guest)
-            .where(Guest.id.in_(guest_ids), Guest.user_id == user.id)
-        )
+        ids = tuple(dict.fromkeys(guest_ids))  # de-duplicated, order kept
+        user_id = user.id
+
+        # IN renders as one expanding parameter, so every list length shares
+        # the same cached statement
+        result = await self.db.execute(lambda_stmt(lambda: (
+            select(Guest).where(Guest.id.in_(ids), Guest.user_id == user_id)
+        )))
         guests = result.scalars().all()
 
-        if len(guests) != len(guest_ids):
+        if len(guests) != len(ids):
             found_ids = {g.id for g in guests}
-            missing_ids = set(guest_ids) - found_ids
+            missing_ids = set(ids) - found_ids
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Guests not found: {missing_ids}"
@@ -1,6 +1,6 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, update, func, and_
+from sqlalchemy.orm import selectinload, raiseload
 from fastapi import HTTPException, status
 from typing import Optional, List
 from datetime import date
@@ -9,7 +9,8 @@ from app.models.hotel import Hotel
 from app.models.room import Room
 from app.models.inventory import Inventory
 from app.models.user import User, UserRole
-from app.schemas.hotel import HotelCreate, HotelUpdate
+from app.schemas.hotel import HotelCreate, HotelUpdate, HotelListResponse, hotels_adapter
+from app.core.cache import HotelMeta, hotel_meta_cache, invalidate_hotel
 
 
 class HotelService:
@@ -34,17 +35,14 @@ class HotelService:
         )
 
         self.db.add(hotel)
-        await self.db.flush()
-        await self.db.refresh(hotel)
+        await self.db.commit()
 
         return hotel
 
     async def get_hotel_by_id(self, hotel_id: int, user: Optional[User] = None) -> Hotel:
         """Get hotel by ID with optional ownership check"""
-        result = await self.db.execute(
-            select(Hotel).where(Hotel.id == hotel_id)
-        )
-        hotel = result.scalar_one_or_none()
+        # Session.get answers repeat lookups in the same request from the identity map
+        hotel = await self.db.get(Hotel, hotel_id)
 
         if not hotel:
             raise HTTPException(
@@ -61,35 +59,72 @@ class HotelService:
 
         return hotel
 
-    async def get_admin_hotels(self, user: User, page: int = 1, page_size: int = 10):
+    async def get_hotel_meta(self, hotel_id: int) -> Optional[HotelMeta]:
+        """Owner, active flag and name of a hotel, cached between requests"""
+        meta = hotel_meta_cache.get(hotel_id)
+        if meta is None:
+            result = await self.db.execute(
+                select(Hotel.owner_id, Hotel.is_active, Hotel.name).where(Hotel.id == hotel_id)
+            )
+            row = result.one_or_none()
+            if row is None:
+                return None
+            meta = hotel_meta_cache[hotel_id] = HotelMeta(*row)
+        return meta
+
+    async def get_admin_hotels(self, user: User, page: int = 1, page_size: int = 10) -> HotelListResponse:
         """Get hotels owned by the user (or all if admin)"""
         offset = (page - 1) * page_size
 
-        query = select(Hotel)
+        filters = []
         if user.role != UserRole.ADMIN:
-            query = query.where(Hotel.owner_id == user.id)
+            filters.append(Hotel.owner_id == user.id)
 
-        # Get total count
-        count_query = select(func.count(Hotel.id))
-        if user.role != UserRole.ADMIN:
-            count_query = count_query.where(Hotel.owner_id == user.id)
-        count_result = await self.db.execute(count_query)
-        total = count_result.scalar()
-
-        # Get paginated hotels
+        # Window count rides along with the page, so no separate COUNT query
         result = await self.db.execute(
-            query.order_by(Hotel.created_at.desc())
+            select(Hotel, func.count().over().label("total"))
+            .where(*filters)
+            .order_by(Hotel.created_at.desc())
             .offset(offset)
             .limit(page_size)
         )
-        hotels = result.scalars().all()
+        rows = result.all()
+        hotels = [row.Hotel for row in rows]
+
+        if rows:
+            total = rows[0].total
+        elif page > 1:
+            # Past the last page there are no rows to carry the count
+            count_result = await self.db.execute(
+                select(func.count(Hotel.id)).where(*filters)
+            )
+            total = count_result.scalar()
+        else:
+            total = 0
+
+        # Rows were validated by the adapter, so the envelope can skip validation
+        return HotelListResponse.model_construct(
+            hotels=hotels_adapter.validate_python(hotels, from_attributes=True),
+            total=total,
+            page=page,
+            page_size=page_size
+        )
+
+    async def stream_admin_hotels(self, user: User):
+        """Yield every hotel owned by the user (or all if admin), one at a time"""
+        query = select(Hotel)
+        if user.role != UserRole.ADMIN:
+            query = query.where(Hotel.owner_id == user.id)
 
-        return {
-            "hotels": hotels,
-            "total": total,
-            "page": page,
-            "page_size": page_size
-        }
+        # Pulled from the server-side cursor in fixed-size batches, so the
+        # full list is never held in memory
+        result = await self.db.stream_scalars(
+            query.options(raiseload("*"))
+            .order_by(Hotel.created_at.desc())
+            .execution_options(yield_per=500)
+        )
+        async for hotel in result:
+            yield hotel
 
     async def update_hotel(
         self,
@@ -98,14 +133,31 @@ class HotelService:
         update_data: HotelUpdate
     ) -> Hotel:
         """Update hotel details"""
-        hotel = await self.get_hotel_by_id(hotel_id, user)
-
         update_dict = update_data.model_dump(exclude_unset=True)
-        for field, value in update_dict.items():
-            setattr(hotel, field, value)
+        if not update_dict:
+            return await self.get_hotel_by_id(hotel_id, user)
+
+        # Ownership goes into the WHERE clause, so an allowed update is a single
+        # UPDATE ... RETURNING with no SELECT first
+        stmt = update(Hotel).where(Hotel.id == hotel_id)
+        if user.role != UserRole.ADMIN:
+            stmt = stmt.where(Hotel.owner_id == user.id)
+        result = await self.db.execute(
+            stmt.values(**update_dict).returning(Hotel),
+            execution_options={"populate_existing": True}
+        )
+        hotel = result.scalar_one_or_none()
 
-        await self.db.flush()
-        await self.db.refresh(hotel)
+        if not hotel:
+            # Missing or not owned; the regular lookup raises the matching error
+            await self.get_hotel_by_id(hotel_id, user)
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Hotel not found"
+            )
+
+        await self.db.commit()
+        invalidate_hotel(hotel_id)
 
         return hotel
 
@@ -113,22 +165,23 @@ class HotelService:
         """Delete a hotel"""
         hotel = await self.get_hotel_by_id(hotel_id, user)
         await self.db.delete(hotel)
-        await self.db.flush()
+        await self.db.commit()
+        invalidate_hotel(hotel_id)
 
     async def activate_hotel(self, hotel_id: int, user: User) -> Hotel:
         """Activate a hotel (make it visible for booking)"""
         hotel = await self.get_hotel_by_id(hotel_id, user)
         hotel.is_active = True
-        await self.db.flush()
-        await self.db.refresh(hotel)
+        await self.db.commit()
+        invalidate_hotel(hotel_id)
         return hotel
 
     async def deactivate_hotel(self, hotel_id: int, user: User) -> Hotel:
         """Deactivate a hotel"""
         hotel = await self.get_hotel_by_id(hotel_id, user)
         hotel.is_active = False
-        await self.db.flush()
-        await self.db.refresh(hotel)
+        await self.db.commit()
+        invalidate_hotel(hotel_id)
         return hotel
 
     # Public methods for hotel browsing
@@ -144,104 +197,98 @@ class HotelService:
         amenities: Optional[List[str]] = None,
         page: int = 1,
         page_size: int = 10
-    ):
+    ) -> HotelListResponse:
         """Search for available hotels"""
         offset = (page - 1) * page_size
 
-        # Base query for active hotels
-        query = select(Hotel).where(Hotel.is_active == True)
-        count_query = select(func.count(Hotel.id)).where(Hotel.is_active == True)
+        # Every filter goes into one statement so pages and totals only ever
+        # see available hotels
+        filters = [Hotel.is_active == True]
 
         # Filter by city
         if city:
-            query = query.where(Hotel.city.ilike(f"%{city}%"))
-            count_query = count_query.where(Hotel.city.ilike(f"%{city}%"))
+            filters.append(Hotel.city.ilike(f"%{city}%"))
 
-        # Get total count
-        count_result = await self.db.execute(count_query)
-        total = count_result.scalar()
+        # Filter by amenities (hotel must have all of them)
+        if amenities:
+            filters.append(Hotel.amenities.contains(amenities))
 
-        # Get paginated hotels
+        # If date range provided, filter by availability
+        if check_in_date and check_out_date:
+            filters.append(self._has_available_room(
+                check_in_date, check_out_date, guests, rooms, min_price, max_price
+            ))
+
+        # Window count rides along with the page, so no separate COUNT query
         result = await self.db.execute(
-            query.options(selectinload(Hotel.rooms))
+            select(Hotel, func.count().over().label("total"))
+            .where(*filters)
+            .options(raiseload("*"))
             .order_by(Hotel.rating.desc())
             .offset(offset)
             .limit(page_size)
         )
-        hotels = result.scalars().all()
+        rows = result.all()
+        hotels = [row.Hotel for row in rows]
+
+        if rows:
+            total = rows[0].total
+        elif page > 1:
+            # Past the last page there are no rows to carry the count
+            count_result = await self.db.execute(
+                select(func.count(Hotel.id)).where(*filters)
+            )
+            total = count_result.scalar()
+        else:
+            total = 0
+
+        return HotelListResponse.model_construct(
+            hotels=hotels_adapter.validate_python(hotels, from_attributes=True),
+            total=total,
+            page=page,
+            page_size=page_size
+        )
 
-        # If date range provided, filter by availability
-        if check_in_date and check_out_date and hotels:
-            available_hotels = []
-            for hotel in hotels:
-                has_availability = await self._check_hotel_availability(
-                    hotel, check_in_date, check_out_date, guests, rooms, min_price, max_price
-                )
-                if has_availability:
-                    available_hotels.append(hotel)
-            hotels = available_hotels
-            total = len(hotels)
-
-        return {
-            "hotels": hotels,
-            "total": total,
-            "page": page,
-            "page_size": page_size
-        }
-
-    async def _check_hotel_availability(
-        self,
-        hotel: Hotel,
+    @staticmethod
+    def _has_available_room(
         check_in_date: date,
         check_out_date: date,
         guests: Optional[int] = None,
         rooms: Optional[int] = None,
         min_price: Optional[float] = None,
         max_price: Optional[float] = None
-    ) -> bool:
-        """Check if hotel has available rooms for the date range"""
-        for room in hotel.rooms:
-            # Check capacity
-            if guests and room.capacity < guests:
-                continue
-
-            # Check price range
-            if min_price and room.base_price < min_price:
-                continue
-            if max_price and room.base_price > max_price:
-                continue
-
-            # Check inventory for all dates
-            result = await self.db.execute(
-                select(Inventory)
-                .where(
-                    Inventory.room_id == room.id,
-                    Inventory.date >= check_in_date,
-                    Inventory.date < check_out_date
-                )
+    ):
+        """EXISTS clause: the hotel has a room with enough left every night of the stay"""
+        nights = (check_out_date - check_in_date).days
+        required_rooms = rooms or 1
+
+        room_query = (
+            select(Room.id)
+            .join(Inventory, Inventory.room_id == Room.id)
+            .where(
+                Room.hotel_id == Hotel.id,
+                Inventory.date >= check_in_date,
+                Inventory.date < check_out_date,
+                Inventory.remaining_count >= required_rooms
             )
-            inventories = result.scalars().all()
-
-            # Check if all dates have availability
-            required_rooms = rooms or 1
-            dates_needed = (check_out_date - check_in_date).days
-
-            if len(inventories) >= dates_needed:
-                all_available = all(
-                    (inv.available_count - inv.booked_count) >= required_rooms
-                    for inv in inventories
-                )
-                if all_available:
-                    return True
+            .group_by(Room.id)
+            .having(func.count(Inventory.id) >= nights)
+        )
+        if guests:
+            room_query = room_query.where(Room.capacity >= guests)
+        if min_price:
+            room_query = room_query.where(Room.base_price >= min_price)
+        if max_price:
+            room_query = room_query.where(Room.base_price <= max_price)
 
-        return False
+        return room_query.exists()
 
     async def get_hotel_info(self, hotel_id: int) -> Hotel:
         """Get hotel details with rooms for public view"""
         result = await self.db.execute(
             select(Hotel)
             .where(Hotel.id == hotel_id, Hotel.is_active == True)
-            .options(selectinload(Hotel.rooms))
+            .options(selectinload(Hotel.rooms), raiseload("*"))
         )
         hotel = result.scalar_one_or_none()
 
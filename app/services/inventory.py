@@ -1,7 +1,8 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import Row, select, and_, func, lambda_stmt, cast, literal, Date, DateTime, Integer, Interval
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from fastapi import HTTPException, status
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from datetime import date, timedelta
 
 from app.models.inventory import Inventory
@@ -9,6 +10,7 @@ from app.models.room import Room
 from app.models.hotel import Hotel
 from app.models.user import User, UserRole
 from app.schemas.inventory import InventoryUpdate, InventoryBulkUpdate
+from app.core.cache import hotel_search_cache
 
 
 class InventoryService:
@@ -17,24 +19,22 @@ class InventoryService:
 
     async def _verify_room_access(self, room_id: int, user: User) -> Room:
         """Verify user has access to the room's hotel"""
+        # The owner comes back with the room in the same query
         result = await self.db.execute(
-            select(Room).where(Room.id == room_id)
+            select(Room, Hotel.owner_id)
+            .join(Hotel, Hotel.id == Room.hotel_id)
+            .where(Room.id == room_id)
         )
-        room = result.scalar_one_or_none()
+        row = result.one_or_none()
 
-        if not room:
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Room not found"
             )
 
-        # Get hotel to check ownership
-        hotel_result = await self.db.execute(
-            select(Hotel).where(Hotel.id == room.hotel_id)
-        )
-        hotel = hotel_result.scalar_one_or_none()
-
-        if user.role != UserRole.ADMIN and hotel.owner_id != user.id:
+        room, owner_id = row
+        if user.role != UserRole.ADMIN and owner_id != user.id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not authorized to access this room's inventory"
@@ -48,7 +48,7 @@ class InventoryService:
         user: User,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None
-    ) -> List[Inventory]:
+    ) -> Sequence[Row]:
         """Get inventory for a room within a date range"""
         await self._verify_room_access(room_id, user)
 
@@ -57,16 +57,17 @@ class InventoryService:
         if not end_date:
             end_date = start_date + timedelta(days=30)
 
-        result = await self.db.execute(
-            select(Inventory)
+        # Read-only path: plain column rows skip identity-map and instance construction
+        result = await self.db.execute(lambda_stmt(lambda: (
+            select(*Inventory.__table__.c)
             .where(
                 Inventory.room_id == room_id,
                 Inventory.date >= start_date,
                 Inventory.date <= end_date
             )
             .order_by(Inventory.date)
-        )
-        return result.scalars().all()
+        )))
+        return result.all()
 
     async def update_inventory(
         self,
@@ -76,32 +77,36 @@ class InventoryService:
         update_data: InventoryUpdate
     ) -> Inventory:
         """Update inventory for a specific date"""
-        await self._verify_room_access(room_id, user)
+        room = await self._verify_room_access(room_id, user)
 
-        result = await self.db.execute(
-            select(Inventory)
-            .where(Inventory.room_id == room_id, Inventory.date == inv_date)
+        # Create the date if it doesn't exist, otherwise update only the fields
+        # that were sent; RETURNING hands back the row in the same round trip
+        stmt = pg_insert(Inventory).values(
+            room_id=room_id,
+            date=inv_date,
+            available_count=update_data.available_count if update_data.available_count is not None else room.total_count,
+            booked_count=0,
+            price=update_data.price if update_data.price is not None else room.base_price,
         )
-        inventory = result.scalar_one_or_none()
-
-        if not inventory:
-            # Create new inventory record if it doesn't exist
-            room = await self._verify_room_access(room_id, user)
-            inventory = Inventory(
-                room_id=room_id,
-                date=inv_date,
-                available_count=update_data.available_count or room.total_count,
-                booked_count=0,
-                price=update_data.price or room.base_price,
-            )
-            self.db.add(inventory)
-        else:
-            update_dict = update_data.model_dump(exclude_unset=True)
-            for field, value in update_dict.items():
-                setattr(inventory, field, value)
+        # updated_at is left to the set_updated_at trigger, which ON CONFLICT DO UPDATE fires
+        set_ = {}
+        if update_data.available_count is not None:
+            set_["available_count"] = stmt.excluded.available_count
+        if update_data.price is not None:
+            set_["price"] = stmt.excluded.price
+        if not set_:
+            # Nothing sent: a no-op SET still lets RETURNING hand back existing dates
+            set_["available_count"] = Inventory.available_count
 
-        await self.db.flush()
-        await self.db.refresh(inventory)
+        result = await self.db.execute(
+            stmt.on_conflict_do_update(index_elements=["room_id", "date"], set_=set_)
+            .returning(Inventory),
+            execution_options={"populate_existing": True}
+        )
+        inventory = result.scalar_one()
+        await self.db.commit()
+        # Search filters on inventory price and availability
+        hotel_search_cache.clear()
 
         return inventory
 
@@ -120,38 +125,45 @@ class InventoryService:
                 detail="Start date must be before end date"
             )
 
-        updated_inventories = []
-        current_date = bulk_data.start_date
+        # The database generates the dates, so the range never becomes a Python list
+        days = func.generate_series(
+            cast(literal(bulk_data.start_date, Date), DateTime),
+            cast(literal(bulk_data.end_date, Date), DateTime),
+            literal(timedelta(days=1), Interval)
+        ).table_valued("value")
+        # New dates fall back to the room's defaults; an explicit 0 closes dates
+        available_count = bulk_data.available_count if bulk_data.available_count is not None else room.total_count
+        price = bulk_data.price if bulk_data.price is not None else room.base_price
+        rows = select(
+            literal(room_id, Integer),
+            cast(days.c.value, Date),
+            literal(available_count, Integer),
+            literal(0, Integer),
+            literal(price, Inventory.price.type),
+        )
 
-        while current_date <= bulk_data.end_date:
-            result = await self.db.execute(
-                select(Inventory)
-                .where(Inventory.room_id == room_id, Inventory.date == current_date)
-            )
-            inventory = result.scalar_one_or_none()
-
-            if not inventory:
-                inventory = Inventory(
-                    room_id=room_id,
-                    date=current_date,
-                    available_count=bulk_data.available_count or room.total_count,
-                    booked_count=0,
-                    price=bulk_data.price or room.base_price,
-                )
-                self.db.add(inventory)
-            else:
-                if bulk_data.available_count is not None:
-                    inventory.available_count = bulk_data.available_count
-                if bulk_data.price is not None:
-                    inventory.price = bulk_data.price
-
-            updated_inventories.append(inventory)
-            current_date += timedelta(days=1)
-
-        await self.db.flush()
-
-        # Refresh all inventories
-        for inv in updated_inventories:
-            await self.db.refresh(inv)
-
-        return updated_inventories
+        # One INSERT ... SELECT ... ON CONFLICT for the whole range; existing
+        # dates only get the fields that were actually sent
+        stmt = pg_insert(Inventory).from_select(
+            ["room_id", "date", "available_count", "booked_count", "price"], rows
+        )
+        # updated_at is left to the set_updated_at trigger, which ON CONFLICT DO UPDATE fires
+        set_ = {}
+        if bulk_data.available_count is not None:
+            set_["available_count"] = stmt.excluded.available_count
+        if bulk_data.price is not None:
+            set_["price"] = stmt.excluded.price
+        if not set_:
+            # Nothing sent: a no-op SET still lets RETURNING hand back existing dates
+            set_["available_count"] = Inventory.available_count
+
+        result = await self.db.execute(
+            stmt.on_conflict_do_update(index_elements=["room_id", "date"], set_=set_)
+            .returning(Inventory),
+            execution_options={"populate_existing": True}
+        )
+        inventories = sorted(result.scalars().all(), key=lambda inv: inv.date)
+        await self.db.commit()
+        hotel_search_cache.clear()
+
+        return inventories
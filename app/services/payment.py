@@ -1,5 +1,9 @@
-import uuid
+import asyncio
+import hashlib
+import hmac
+import secrets
 from datetime import datetime, timedelta
+from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from fastapi import HTTPException, status
@@ -8,6 +12,14 @@ from app.models.payment import Payment, PaymentStatus, PaymentMethod
 from app.models.booking import Booking, BookingStatus
 from app.models.user import User
 from app.schemas.payment import PaymentInitiate
+from app.core.config import settings
+from app.core.cache import booking_status_cache, hotel_search_cache
+
+
+def _verify_signature(body: bytes, signature: str, secret: str) -> bool:
+    """Check a hex HMAC-SHA256 signature of the raw webhook body"""
+    expected = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature)
 
 
 class PaymentService:
@@ -23,11 +35,14 @@ class PaymentService:
         payment_data: PaymentInitiate
     ):
         """Initiate payment for a booking"""
-        # Get booking
+        # Get the user's booking and any existing payment in one round trip.
+        # Other users' bookings look missing, so ids can't be probed.
         result = await self.db.execute(
-            select(Booking).where(Booking.id == booking_id)
+            select(Booking, Payment)
+            .outerjoin(Payment, Payment.booking_id == Booking.id)
+            .where(Booking.id == booking_id, Booking.user_id == user.id)
         )
-        booking = result.scalar_one_or_none()
+        booking, existing_payment = result.first() or (None, None)
 
         if not booking:
             raise HTTPException(
@@ -35,24 +50,12 @@ class PaymentService:
                 detail="Booking not found"
             )
 
-        if booking.user_id != user.id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to pay for this booking"
-            )
-
         if booking.status != BookingStatus.PENDING:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Booking is not in pending status"
             )
 
-        # Check if payment already exists
-        payment_result = await self.db.execute(
-            select(Payment).where(Payment.booking_id == booking_id)
-        )
-        existing_payment = payment_result.scalar_one_or_none()
-
         if existing_payment:
             if existing_payment.status == PaymentStatus.COMPLETED:
                 raise HTTPException(
@@ -70,7 +73,7 @@ class PaymentService:
                 }
 
         # Generate mock payment session
-        payment_session_id = f"pay_session_{uuid.uuid4().hex[:16]}"
+        payment_session_id = f"pay_session_{secrets.token_hex(8)}"
 
         # Create payment record
         payment = Payment(
@@ -87,8 +90,8 @@ class PaymentService:
         # Update booking with payment session ID
         booking.payment_session_id = payment_session_id
 
-        await self.db.flush()
-        await self.db.refresh(payment)
+        await self.db.commit()
+        booking_status_cache.pop(booking_id, None)
 
         return {
             "payment_session_id": payment_session_id,
@@ -98,13 +101,28 @@ class PaymentService:
             "expires_at": datetime.utcnow() + timedelta(minutes=30)
         }
 
+    async def verify_webhook_signature(self, body: bytes, signature: Optional[str]) -> None:
+        """Reject webhooks not signed with PAYMENT_WEBHOOK_SECRET (when configured)"""
+        secret = settings.PAYMENT_WEBHOOK_SECRET
+        if not secret:
+            return
+
+        # Hashing is CPU-bound, run it in the worker pool instead of on the event loop
+        if not signature or not await asyncio.to_thread(_verify_signature, body, signature, secret):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid webhook signature"
+            )
+
     async def process_webhook(self, webhook_data):
         """Process payment webhook from payment gateway"""
-        # Find payment by session ID
+        # Find payment by session ID, with its booking
         result = await self.db.execute(
-            select(Payment).where(Payment.payment_session_id == webhook_data.payment_session_id)
+            select(Payment, Booking)
+            .outerjoin(Booking, Booking.id == Payment.booking_id)
+            .where(Payment.payment_session_id == webhook_data.payment_session_id)
         )
-        payment = result.scalar_one_or_none()
+        payment, booking = result.first() or (None, None)
 
         if not payment:
             raise HTTPException(
@@ -118,12 +136,6 @@ class PaymentService:
                 detail="Payment already processed"
             )
 
-        # Get booking
-        booking_result = await self.db.execute(
-            select(Booking).where(Booking.id == payment.booking_id)
-        )
-        booking = booking_result.scalar_one_or_none()
-
         if not booking:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -139,9 +151,8 @@ class PaymentService:
             # Update booking status to CONFIRMED
             booking.status = BookingStatus.CONFIRMED
 
-            await self.db.flush()
-            await self.db.refresh(payment)
-            await self.db.refresh(booking)
+            await self.db.commit()
+            booking_status_cache.pop(booking.id, None)
 
             return {
                 "message": "Payment successful",
@@ -158,9 +169,9 @@ class PaymentService:
             # Keep booking in pending, or you could expire it
             booking.status = BookingStatus.EXPIRED
 
-            await self.db.flush()
-            await self.db.refresh(payment)
-            await self.db.refresh(booking)
+            await self.db.commit()
+            booking_status_cache.pop(booking.id, None)
+            hotel_search_cache.clear()
 
             return {
                 "message": "Payment failed",
@@ -172,11 +183,14 @@ class PaymentService:
 
     async def get_payment_by_booking(self, booking_id: int, user: User) -> Payment:
         """Get payment details for a booking"""
-        # Get booking first to verify access
-        booking_result = await self.db.execute(
-            select(Booking).where(Booking.id == booking_id)
+        # The user's booking and its payment in one round trip; other users'
+        # bookings look missing
+        result = await self.db.execute(
+            select(Booking, Payment)
+            .outerjoin(Payment, Payment.booking_id == Booking.id)
+            .where(Booking.id == booking_id, Booking.user_id == user.id)
         )
-        booking = booking_result.scalar_one_or_none()
+        booking, payment = result.first() or (None, None)
 
         if not booking:
             raise HTTPException(
@@ -184,17 +198,6 @@ class PaymentService:
                 detail="Booking not found"
             )
 
-        if booking.user_id != user.id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to view this payment"
-            )
-
-        result = await self.db.execute(
-            select(Payment).where(Payment.booking_id == booking_id)
-        )
-        payment = result.scalar_one_or_none()
-
         if not payment:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
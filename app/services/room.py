@@ -1,26 +1,29 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, update, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from fastapi import HTTPException, status
 from typing import List
 from datetime import date, timedelta
 
 from app.models.room import Room
-from app.models.hotel import Hotel
 from app.models.inventory import Inventory
 from app.models.user import User, UserRole
 from app.schemas.room import RoomCreate, RoomUpdate
+from app.services.hotel import HotelService
+from app.core.cache import invalidate_hotel
 
 
 class RoomService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def _verify_hotel_access(self, hotel_id: int, user: User) -> Hotel:
+    async def _verify_hotel_access(self, hotel_id: int, user: User) -> None:
         """Verify user has access to the hotel"""
-        result = await self.db.execute(
-            select(Hotel).where(Hotel.id == hotel_id)
-        )
-        hotel = result.scalar_one_or_none()
+        if user.owns_hotel(hotel_id):
+            return
+
+        # Only the owner is needed, and that is cached between requests
+        hotel = await HotelService(self.db).get_hotel_meta(hotel_id)
 
         if not hotel:
             raise HTTPException(
@@ -34,8 +37,6 @@ class RoomService:
                 detail="Not authorized to access this hotel"
             )
 
-        return hotel
-
     async def create_room(
         self,
         hotel_id: int,
@@ -59,31 +60,34 @@ class RoomService:
 
         self.db.add(room)
         await self.db.flush()
-        await self.db.refresh(room)
 
         # Initialize inventory for the next 90 days
         await self._initialize_inventory(room)
+        await self.db.commit()
+        invalidate_hotel(hotel_id)
 
         return room
 
     async def _initialize_inventory(self, room: Room, days: int = 90):
         """Initialize inventory for a room for the next N days"""
         today = date.today()
-        inventories = []
-
-        for i in range(days):
-            inv_date = today + timedelta(days=i)
-            inventory = Inventory(
-                room_id=room.id,
-                date=inv_date,
-                available_count=room.total_count,
-                booked_count=0,
-                price=room.base_price,
-            )
-            inventories.append(inventory)
-
-        self.db.add_all(inventories)
-        await self.db.flush()
+        rows = [
+            {
+                "room_id": room.id,
+                "date": today + timedelta(days=i),
+                "available_count": room.total_count,
+                "booked_count": 0,
+                "price": room.base_price,
+            }
+            for i in range(days)
+        ]
+
+        # One multi-row INSERT; nothing reads these back through the session
+        await self.db.execute(
+            pg_insert(Inventory)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=["room_id", "date"])
+        )
 
     async def get_rooms(self, hotel_id: int, user: User) -> List[Room]:
         """Get all rooms for a hotel"""
@@ -127,14 +131,30 @@ class RoomService:
         update_data: RoomUpdate
     ) -> Room:
         """Update a room"""
-        room = await self.get_room_by_id(hotel_id, room_id, user)
-
         update_dict = update_data.model_dump(exclude_unset=True)
-        for field, value in update_dict.items():
-            setattr(room, field, value)
+        if not update_dict:
+            return await self.get_room_by_id(hotel_id, room_id, user)
 
-        await self.db.flush()
-        await self.db.refresh(room)
+        await self._verify_hotel_access(hotel_id, user)
+
+        # Single UPDATE ... RETURNING instead of loading the room first
+        result = await self.db.execute(
+            update(Room)
+            .where(Room.id == room_id, Room.hotel_id == hotel_id)
+            .values(**update_dict)
+            .returning(Room),
+            execution_options={"populate_existing": True}
+        )
+        room = result.scalar_one_or_none()
+
+        if not room:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Room not found"
+            )
+
+        await self.db.commit()
+        invalidate_hotel(hotel_id)
 
         return room
 
@@ -147,4 +167,5 @@ class RoomService:
         """Delete a room"""
         room = await self.get_room_by_id(hotel_id, room_id, user)
         await self.db.delete(room)
-        await self.db.flush()
+        await self.db.commit()
+        invalidate_hotel(hotel_id)
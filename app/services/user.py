@@ -1,11 +1,12 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, func, lambda_stmt
 from fastapi import HTTPException, status
 
 from app.models.user import User
 from app.models.booking import Booking
 from app.schemas.user import UserUpdate
+from app.schemas.booking import BookingListResponse, booking_detail_row, booking_details_adapter
+from app.core.cache import user_cache
 
 
 class UserService:
@@ -23,8 +24,8 @@ class UserService:
         for field, value in update_dict.items():
             setattr(user, field, value)
 
-        await self.db.flush()
-        await self.db.refresh(user)
+        await self.db.commit()
+        user_cache.pop(user.id, None)
 
         return user
 
@@ -33,34 +34,40 @@ class UserService:
         user: User,
         page: int = 1,
         page_size: int = 10
-    ):
+    ) -> BookingListResponse:
         """Get user's bookings with pagination"""
         offset = (page - 1) * page_size
+        user_id = user.id
 
-        # Get total count
-        count_result = await self.db.execute(
-            select(Booking).where(Booking.user_id == user.id)
-        )
-        total = len(count_result.scalars().all())
-
-        # Get paginated bookings with relationships
-        result = await self.db.execute(
-            select(Booking)
-            .where(Booking.user_id == user.id)
-            .options(
-                selectinload(Booking.hotel),
-                selectinload(Booking.room),
-                selectinload(Booking.guests)
-            )
+        # Window count rides along with the page, so no separate COUNT query
+        result = await self.db.execute(lambda_stmt(lambda: (
+            Booking.select_with_details()
+            .add_columns(func.count().over().label("total"))
+            .where(Booking.user_id == user_id)
             .order_by(Booking.created_at.desc())
             .offset(offset)
             .limit(page_size)
-        )
-        bookings = result.scalars().all()
+        )))
+        rows = result.all()
+        bookings = [row.Booking for row in rows]
 
-        return {
-            "bookings": bookings,
-            "total": total,
-            "page": page,
-            "page_size": page_size
-        }
+        if rows:
+            total = rows[0].total
+        elif page > 1:
+            # Past the last page there are no rows to carry the count
+            count_result = await self.db.execute(
+                lambda_stmt(lambda: select(func.count(Booking.id)).where(Booking.user_id == user_id))
+            )
+            total = count_result.scalar_one()
+        else:
+            total = 0
+
+        # Rows were validated by the adapter, so the envelope can skip validation
+        return BookingListResponse.model_construct(
+            bookings=booking_details_adapter.validate_python(
+                [booking_detail_row(b) for b in bookings]
+            ),
+            total=total,
+            page=page,
+            page_size=page_size
+        )
@@ -0,0 +1,146 @@
+import os
+
+os.environ.setdefault("DEBUG", "false")
+
+from contextlib import contextmanager
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.db.base import Base
+from app.db.session import get_db
+from app.core import cache
+from app.core.security import create_access_token
+from app.models.user import User, UserRole
+from app.models.hotel import Hotel
+from app.models.room import Room, RoomType
+from app.models.inventory import Inventory
+from app.models.booking import Booking, BookingStatus
+from app.models.guest import Guest
+
+# Postgres when TEST_DATABASE_URL is set, otherwise an in-memory SQLite database
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL", "sqlite+aiosqlite://")
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_sqlite(type_, compiler, **kw):
+    return "JSON"
+
+
+@pytest_asyncio.fixture
+async def engine():
+    if TEST_DATABASE_URL.startswith("sqlite"):
+        # One shared connection, so every session sees the same in-memory database
+        engine = create_async_engine(TEST_DATABASE_URL, poolclass=StaticPool)
+    else:
+        engine = create_async_engine(TEST_DATABASE_URL)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def session_factory(engine):
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False, autoflush=False)
+
+
+@pytest_asyncio.fixture
+async def client(session_factory):
+    """API client whose requests use the test database"""
+    async def override_get_db():
+        async with session_factory() as session:
+            try:
+                yield session
+            except Exception:
+                await session.rollback()
+                raise
+
+    # Cached responses and users would otherwise leak between tests
+    for name in dir(cache):
+        if name.endswith("_cache"):
+            getattr(cache, name).clear()
+
+    app.dependency_overrides[get_db] = override_get_db
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def count_queries(engine):
+    """Record the SQL statements sent while the returned context manager is open
+
+        with count_queries() as queries:
+            ...
+        assert len(queries) == 2
+    """
+    @contextmanager
+    def counter():
+        queries = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            queries.append(statement)
+
+        event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield queries
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+    return counter
+
+
+def auth_headers(user: User) -> dict:
+    return {"Authorization": f"Bearer {create_access_token(data={'sub': str(user.id)})}"}
+
+
+@pytest_asyncio.fixture
+async def seed(session_factory):
+    """An owner with one active hotel and room, and a guest with two bookings there"""
+    async with session_factory() as db:
+        owner = User(email="owner@example.com", hashed_password="x", name="Owner", role=UserRole.HOTEL_ADMIN)
+        guest = User(email="guest@example.com", hashed_password="x", name="Guest")
+        db.add_all([owner, guest])
+        await db.flush()
+
+        hotel = Hotel(owner_id=owner.id, name="Seaside", city="Lisbon", amenities=["wifi"], is_active=True)
+        db.add(hotel)
+        await db.flush()
+
+        room = Room(hotel_id=hotel.id, name="Double", room_type=RoomType.DOUBLE, base_price=Decimal("100"), total_count=3, capacity=2)
+        db.add(room)
+        await db.flush()
+
+        start = date.today() + timedelta(days=1)
+        db.add_all([
+            Inventory(room_id=room.id, date=start + timedelta(days=i), available_count=3, booked_count=0, price=Decimal("100"))
+            for i in range(10)
+        ])
+
+        companion = Guest(user_id=guest.id, name="Companion", age=30)
+        bookings = [
+            Booking(
+                user_id=guest.id, hotel_id=hotel.id, room_id=room.id,
+                check_in_date=start + timedelta(days=i), check_out_date=start + timedelta(days=i + 1),
+                rooms_count=1, total_price=Decimal("100"), status=BookingStatus.CONFIRMED,
+                guests=[companion],
+            )
+            for i in range(2)
+        ]
+        db.add_all(bookings)
+        await db.commit()
+
+        return {"owner": owner, "guest": guest, "hotel": hotel, "room": room, "start": start}
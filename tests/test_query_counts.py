@@ -0,0 +1,70 @@
+"""Statement budgets for the list and info endpoints.
+
+Relationships are loaded explicitly and everything else raises (raiseload),
+so an unplanned lazy load fails the request instead of adding a query.
+"""
+from datetime import timedelta
+
+import pytest
+
+from tests.conftest import auth_headers
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_my_bookings(client, seed, count_queries):
+    with count_queries() as queries:
+        response = await client.get("/api/v1/users/myBookings", headers=auth_headers(seed["guest"]))
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == 2
+    assert body["bookings"][0]["guests"][0]["name"] == "Companion"
+    # user, page with hotel/room and window count, guests
+    assert len(queries) == 3
+
+
+async def test_hotel_bookings(client, seed, count_queries):
+    with count_queries() as queries:
+        response = await client.get(
+            f"/api/v1/admin/hotels/{seed['hotel'].id}/bookings", headers=auth_headers(seed["owner"])
+        )
+
+    assert response.status_code == 200
+    assert response.json()["total"] == 2
+    # user, owned hotel ids, page with hotel/room and window count, guests
+    assert len(queries) == 4
+
+
+async def test_hotel_info(client, seed, count_queries):
+    with count_queries() as queries:
+        response = await client.get(f"/api/v1/hotels/{seed['hotel'].id}/info")
+
+    assert response.status_code == 200
+    assert [room["name"] for room in response.json()["rooms"]] == ["Double"]
+    # hotel, rooms
+    assert len(queries) == 2
+
+    # Served from the response cache afterwards
+    with count_queries() as queries:
+        response = await client.get(f"/api/v1/hotels/{seed['hotel'].id}/info")
+    assert response.status_code == 200
+    assert queries == []
+
+
+async def test_search(client, seed, count_queries):
+    params = {
+        "city": "lis",
+        "check_in_date": str(seed["start"]),
+        "check_out_date": str(seed["start"] + timedelta(days=2)),
+    }
+
+    with count_queries() as queries:
+        response = await client.get("/api/v1/hotels/search", params=params)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == 1
+    assert body["hotels"][0]["name"] == "Seaside"
+    # hotels with availability filter and window count
+    assert len(queries) == 1
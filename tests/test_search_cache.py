@@ -0,0 +1,36 @@
+from datetime import timedelta
+
+import pytest
+
+from tests.conftest import auth_headers
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_bookings_invalidate_cached_search(client, seed):
+    check_in, check_out = seed["start"], seed["start"] + timedelta(days=2)
+    params = {"city": "lis", "check_in_date": str(check_in), "check_out_date": str(check_out)}
+    headers = auth_headers(seed["guest"])
+
+    async def search_total():
+        response = await client.get("/api/v1/hotels/search", params=params)
+        assert response.status_code == 200
+        return response.json()["total"]
+
+    assert await search_total() == 1
+
+    # Booking every room sells the dates out
+    response = await client.post("/api/v1/bookings/init", headers=headers, json={
+        "hotel_id": seed["hotel"].id,
+        "room_id": seed["room"].id,
+        "check_in_date": str(check_in),
+        "check_out_date": str(check_out),
+        "rooms_count": 3,
+    })
+    assert response.status_code == 201
+    assert await search_total() == 0
+
+    # Cancelling frees them again
+    response = await client.post(f"/api/v1/bookings/{response.json()['id']}/cancel", headers=headers, json={})
+    assert response.status_code == 200
+    assert await search_total() == 1
@@ -0,0 +1,41 @@
+from fastapi import Depends
+import pytest
+
+from app.main import app
+from app.db.session import get_db
+from app.core.dependencies import get_access_token_payload, get_current_user, get_user_service
+from app.services.user import UserService
+from tests.conftest import auth_headers
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_auth_and_handler_share_one_session(client, seed):
+    opened = []
+    seen = {}
+    test_get_db = app.dependency_overrides[get_db]
+
+    async def recording_get_db():
+        async for session in test_get_db():
+            opened.append(session)
+            yield session
+
+    async def recording_current_user(payload: dict = Depends(get_access_token_payload), db=Depends(get_db)):
+        seen["auth"] = id(db)
+        return await get_current_user(payload, db)
+
+    def recording_user_service(db=Depends(get_db)):
+        seen["handler"] = id(db)
+        return UserService(db)
+
+    app.dependency_overrides.update({
+        get_db: recording_get_db,
+        get_current_user: recording_current_user,
+        get_user_service: recording_user_service,
+    })
+
+    response = await client.get("/api/v1/users/myBookings", headers=auth_headers(seed["guest"]))
+
+    assert response.status_code == 200
+    assert len(opened) == 1
+    assert seen["auth"] == seen["handler"] == id(opened[0])